@@ -1,3 +1,4 @@
 from .command import JinjaCommand
+from .batch import JinjaBatchCommand
 
-__all__ = ["JinjaCommand"]
+__all__ = ["JinjaCommand", "JinjaBatchCommand"]
@@ -0,0 +1,251 @@
+import copy
+import json
+import os
+import sys
+import threading
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TYPE_CHECKING, Optional
+from godocs.cli.command import CLICommand
+from godocs_jinja.cli.command import JinjaCommand
+from godocs_jinja.constructor import JinjaConstructor, Tracer
+
+if TYPE_CHECKING:
+    from argparse import _SubParsersAction  # type: ignore
+    from godocs.cli.command.cli_command import Processor
+
+SETUP_OPTIONS = [
+    "model",
+    "templates",
+    "filters",
+    "builders",
+    "format",
+    "cache_dir",
+    "reload_templates",
+    "class_page_size",
+    "index_fan_out",
+    "index_grouping",
+    "enable_async",
+    "async_concurrency",
+    "fragment_cache_size",
+    "fragment_cache_dir",
+]
+"""
+The **options** of a project that **define** how its `JinjaConstructor`
+is **set up**. Projects where these are **equal** share the same constructor.
+"""
+
+PATH_OPTIONS = [
+    "input_dir",
+    "output_dir",
+    "options_file",
+    "templates",
+    "filters",
+    "builders",
+    "cache_dir",
+    "inventory",
+    "changeset",
+    "snapshot_dir",
+    "fragment_cache_dir",
+    "progress_report",
+    "trace",
+]
+"""
+The **options** of a project that are **paths**, which are **resolved**
+relative to the **manifest** directory.
+"""
+
+
+class JinjaBatchCommand(CLICommand):
+    """
+    A `CLICommand` that **constructs** the documentation of **many projects**
+    listed in a **manifest** in a **single process**.
+
+    Projects are **scheduled** over a **shared pool** of worker threads, and
+    the ones with the **same setup** (model, templates, filters, builders...)
+    **share** a single `JinjaConstructor`, so its **filters**, **builders** and
+    **Jinja environment** (with its compiled templates) are created only once.
+
+    The **manifest** is a **JSON** file with a `projects` list, each project
+    being an object with the **options** of the `jinja` command by their
+    **destination** names (`input_dir`, `output_dir`, `options_file`,
+    `class_page_size`...). Optional `defaults` apply to all projects and
+    `workers` sets the size of the pool.
+    """
+
+    parser: ArgumentParser
+    """
+    The `argparse.ArgumentParser` instance this `JinjaBatchCommand` uses.
+    """
+
+    jinja: JinjaCommand
+    """
+    The `JinjaCommand` whose **options** projects accept and whose logic
+    is used to **construct** them.
+    """
+
+    processor: "Processor"
+    """
+    The **processor** that **parses** the **XML** docs of a project
+    into its **context**.
+    """
+
+    constructors: dict[tuple[Any, ...], JinjaConstructor]
+    """
+    The `JinjaConstructors` created so far, by their **setup** options.
+    """
+
+    def __init__(self, jinja: JinjaCommand, processor: "Processor"):
+        self.jinja = jinja
+        self.processor = processor
+        self.constructors = {}
+        self.lock = threading.Lock()
+
+    def register(
+        self,
+        superparsers: "Optional[_SubParsersAction[ArgumentParser]]" = None,
+        parent_parser: Optional[ArgumentParser] = None,
+        processors: "Optional[list[Processor]]" = None
+    ):
+        """
+        Registers this `JinjaBatchCommand` as a subparser for the
+        `subparsers` received.
+        """
+
+        if superparsers is None:
+            raise ValueError(
+                'superparsers is needed for "jinja-batch" registration')
+
+        self.parser = superparsers.add_parser(
+            "jinja-batch", help="Construct docs of many projects using a shared Jinja constructor.")
+
+        self.parser.add_argument(
+            "manifest", help="Path to JSON manifest with the projects to construct."
+        )
+        self.parser.add_argument(
+            "-w", "--workers",
+            type=int,
+            help="Number of projects constructed at the same time. Defaults to the manifest workers or the CPU count."
+        )
+        self.parser.set_defaults(execute=self.execute)
+
+    def execute(self, args: Namespace):
+        """
+        Executes the main logic of this command with the parsed `args`.
+        """
+
+        path = Path(args.manifest)
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+
+        projects = self.load_projects(data, path.parent)
+
+        workers = args.workers or data.get("workers") or os.cpu_count() or 1
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                (project, pool.submit(self.construct_project, project))
+                for project in projects
+            ]
+
+        failures: list[str] = []
+
+        for project, future in futures:
+            error = future.exception()
+
+            if error is not None:
+                failures.append(f"{project.input_dir}: {error!r}")
+
+        if failures:
+            for failure in failures:
+                print(failure, file=sys.stderr)
+
+            raise RuntimeError(
+                f"{len(failures)} of {len(projects)} projects failed to be constructed")
+
+    def load_projects(self, data: dict[str, Any], root: Path) -> list[Namespace]:
+        """
+        **Returns** the **projects** of the **manifest** `data` as `Namespaces`
+        like the ones the `jinja` command receives, with the **defaults** of
+        its options and with **paths** relative to the `root`.
+
+        A `ValueError` is **raised** if a project is **missing** its `input_dir`
+        or `output_dir`, or if it (or the `defaults`) has **unknown** options.
+        """
+
+        defaults = vars(self.jinja.parser.parse_args(["", ""]))
+
+        known = set(defaults) - {"execute"}
+
+        self.check_options(data.get("defaults") or {}, known, "defaults")
+
+        defaults.update(data.get("defaults") or {})
+
+        projects: list[Namespace] = []
+
+        for number, project in enumerate(data.get("projects") or [], 1):
+            self.check_options(project, known, f"project {number}")
+
+            options = {**defaults, **project}
+
+            for key in ["input_dir", "output_dir"]:
+                if not options.get(key):
+                    raise ValueError(f'project {number} is missing "{key}"')
+
+            for key in PATH_OPTIONS:
+                if options.get(key) is not None:
+                    options[key] = str(root / options[key])
+
+            for key in ["model", "translator"]:
+                if options.get(key) is not None and (root / options[key]).exists():
+                    options[key] = str(root / options[key])
+
+            projects.append(Namespace(**options))
+
+        return projects
+
+    def check_options(self, options: dict[str, Any], known: set[str], where: str):
+        """
+        **Raises** a `ValueError` if the `options` of the manifest entry
+        `where` have **keys** that aren't `known` **option** names.
+        """
+
+        unknown = sorted(set(options) - known)
+
+        if unknown:
+            raise ValueError(
+                f"{where} has unknown options {unknown}, expected some of {sorted(known)}")
+
+    def get_constructor(self, args: Namespace) -> JinjaConstructor:
+        """
+        **Returns** a **copy** of the `JinjaConstructor` **set up** for
+        the project `args`, **creating** it on first use.
+        """
+
+        key = tuple(getattr(args, option) for option in SETUP_OPTIONS)
+
+        with self.lock:
+            constructor = self.constructors.get(key)
+
+            if constructor is None:
+                constructor = self.jinja.create_constructor(args)
+
+                self.constructors[key] = constructor
+
+        return copy.copy(constructor)
+
+    def construct_project(self, args: Namespace):
+        """
+        **Parses** the **XML** docs of the project `args` and **constructs**
+        its documentation with a **shared** `JinjaConstructor`.
+        """
+
+        args.tracer = Tracer() if args.trace is not None else None
+
+        args = self.processor(args)
+
+        constructor = self.jinja.configure_constructor(
+            self.get_constructor(args), args)
+
+        self.jinja.construct(constructor, args)
@@ -1,14 +1,36 @@
-from argparse import ArgumentParser, Namespace
-from typing import cast, TYPE_CHECKING, Optional
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
+from pathlib import Path
+from typing import Callable, cast, TYPE_CHECKING, Optional
 from godocs.cli.command import CLICommand
-from godocs_jinja.constructor import JinjaConstructor
+from godocs_jinja.constructor import JinjaConstructor, Tracer, selection
 from godocs.constructor.constructor import ConstructorContext
+from godocs_jinja.cli import snapshot
 
 if TYPE_CHECKING:
     from argparse import _SubParsersAction  # type: ignore
     from godocs.cli.command.cli_command import Processor
 
 
+def int_at_least(minimum: int) -> Callable[[str], int]:
+    """
+    **Returns** an `argparse` **type** that **parses** an `int` no
+    smaller than `minimum`.
+    """
+
+    def parse(value: str) -> int:
+        try:
+            number = int(value)
+        except ValueError:
+            raise ArgumentTypeError(f"invalid int value: {value!r}")
+
+        if number < minimum:
+            raise ArgumentTypeError(f"must be at least {minimum}, got {number}")
+
+        return number
+
+    return parse
+
+
 class JinjaCommand(CLICommand):
     """
     A `CLICommand` that allows defining the behavior of the
@@ -67,20 +89,269 @@ class JinjaCommand(CLICommand):
             "-B", "--builders",
             help="Path to script with builders dict."
         )
+        self.parser.add_argument(
+            "-C", "--cache-dir",
+            help="Path to directory where a manifest of the model and the bytecode of its scripts are cached."
+        )
+        self.parser.add_argument(
+            "--reload-templates",
+            action="store_true",
+            help="Check templates for changes whenever they're used, instead of reading them into memory once."
+        )
+        self.parser.add_argument(
+            "--class-page-size",
+            type=int,
+            help="Maximum number of members in a class page. Bigger classes are split into an overview and member pages."
+        )
+        self.parser.add_argument(
+            "--index-fan-out",
+            type=int_at_least(2),
+            help="Maximum number of entries in the toctree of an index page. Builds a tree of index pages, grouping the classes as set by --index-grouping."
+        )
+        self.parser.add_argument(
+            "--index-grouping",
+            choices=["alphabet", "namespace", "parents"],
+            default="alphabet",
+            help="How classes are grouped into index pages when --index-fan-out is given: by the letters starting their names, by namespace or by parent class."
+        )
+        self.parser.add_argument(
+            "--inventory",
+            help="Path to file where an inventory of the labels of every class and member is written. Uses the Sphinx objects.inv format if the file has the .inv extension, else JSON."
+        )
+        self.parser.add_argument(
+            "--changeset",
+            help="Path to JSON file where the output files added, modified, unchanged and removed by the construction are written, with their hashes. Compared with the previous changeset in the same path, if any, else with the documents of the --format in the output-dir."
+        )
+        self.parser.add_argument(
+            "-S", "--snapshot-dir",
+            help="Path to directory where snapshots of the parsed context are cached, to skip parsing XML that didn't change."
+        )
+        self.parser.add_argument(
+            "--async",
+            dest="enable_async",
+            action="store_true",
+            help="Render templates with an async Jinja environment, allowing async builders and rendering classes concurrently."
+        )
+        self.parser.add_argument(
+            "--async-concurrency",
+            type=int_at_least(1),
+            default=8,
+            help="Maximum number of documents rendered at the same time by the default async builders."
+        )
+        self.parser.add_argument(
+            "--fragment-cache-size",
+            type=int,
+            default=1024,
+            help="Maximum number of fragments rendered by {% cache %} blocks kept in memory."
+        )
+        self.parser.add_argument(
+            "--fragment-cache-dir",
+            help="Path to directory where fragments rendered by {% cache %} blocks are stored between runs."
+        )
+        self.parser.add_argument(
+            "-P", "--progress",
+            action="store_true",
+            help="Report pages written, pages/s, bytes written and ETA while constructing."
+        )
+        self.parser.add_argument(
+            "--progress-report",
+            help="Path to JSON Lines file where a summary of the construction is appended. Implies --progress."
+        )
+        self.parser.add_argument(
+            "--only",
+            action="append",
+            metavar="CLASS",
+            help="Name or glob pattern of a class to build, or @ followed by the path to a file listing them, one per line. Can be repeated. Only the class pages selected are built, along with the index if the classes or their brief descriptions changed since the last selective build."
+        )
+        self.parser.add_argument(
+            "--render-time-budget",
+            type=float,
+            metavar="SECONDS",
+            help="Maximum number of seconds rendering a single document can take. Documents exceeding it are skipped and reported with their template and class."
+        )
+        self.parser.add_argument(
+            "--render-size-budget",
+            type=int,
+            metavar="CHARACTERS",
+            help="Maximum number of characters a single document can have. Documents exceeding it are skipped and reported with their template and class."
+        )
+        self.parser.add_argument(
+            "--budget-fail-fast",
+            action="store_true",
+            help="Stop the construction when a document exceeds a render budget, instead of skipping it."
+        )
+        self.parser.add_argument(
+            "--check-refs",
+            action="store_true",
+            help="Report :ref: references with no label target in the documents constructed, with the class and member they're in."
+        )
+        self.parser.add_argument(
+            "--strict-refs",
+            action="store_true",
+            help="Fail the construction when some :ref: references have no label target. Implies --check-refs."
+        )
+        self.parser.add_argument(
+            "--trace",
+            help="Path to file where a Chrome trace-event timeline of the setup, builders, renders and writes is written."
+        )
         self.parser.set_defaults(execute=self.execute)
 
+    def wrap_processor(self, processor: "Processor") -> "Processor":
+        """
+        **Wraps** the `processor` that **parses** the **XML** docs into
+        `args.ctx`, so that when a `--snapshot-dir` is given, the context is
+        **loaded** from a **snapshot** of a previous run with the **same
+        sources** instead, only calling the `processor` if there's none.
+
+        The snapshot found, if any, is stored in `args.snapshot`.
+        """
+
+        def process(args: Namespace) -> Namespace:
+            if getattr(args, "snapshot_dir", None) is None:
+                return processor(args)
+
+            key = snapshot.get_key(
+                args.input_dir, args.options_file, args.translator)
+
+            args.snapshot_key = key
+            args.snapshot = snapshot.read(
+                snapshot.get_path(args.snapshot_dir, key))
+
+            if args.snapshot is None:
+                return processor(args)
+
+            args.ctx = args.snapshot["context"]
+
+            return args
+
+        return process
+
     def execute(self, args: Namespace):
         """
         Executes the main logic of this command with the parsed `args`.
         """
 
-        constructor = JinjaConstructor(
+        args.tracer = Tracer() if args.trace is not None else None
+
+        constructor = self.create_constructor(args)
+
+        self.configure_constructor(constructor, args)
+
+        self.construct(constructor, args)
+
+    def create_constructor(self, args: Namespace) -> JinjaConstructor:
+        """
+        **Creates** a `JinjaConstructor` set up with the **model**,
+        **templates**, **filters** and **builders** from the `args`.
+
+        Constructors with the **same setup** can be **reused** for
+        **different** contexts and outputs, after
+        `configure_constructor` is used on a **copy** of them.
+        """
+
+        return JinjaConstructor(
             model=args.model,
             templates_path=args.templates,
             filters_path=args.filters,
             builders_path=args.builders,
             output_format=args.format,
+            cache_path=args.cache_dir,
+            frozen_templates=not args.reload_templates,
+            class_page_size=args.class_page_size,
+            index_fan_out=args.index_fan_out,
+            index_grouping=args.index_grouping,
+            enable_async=args.enable_async,
+            async_concurrency=args.async_concurrency,
+            fragment_cache_size=args.fragment_cache_size,
+            fragment_cache_path=args.fragment_cache_dir,
+            tracer=getattr(args, "tracer", None),
+        )
+
+    def configure_constructor(self, constructor: JinjaConstructor, args: Namespace) -> JinjaConstructor:
+        """
+        **Configures** the `constructor` with the `args` that only
+        **affect** a single **construction**, such as the **inventory** path
+        or the `Tracer` in `args.tracer`.
+
+        Returns:
+            JinjaConstructor: The `constructor` received.
+        """
+
+        constructor.configure(
+            inventory_path=args.inventory,
+            changeset_path=args.changeset,
+            progress=args.progress,
+            progress_report_path=args.progress_report,
+            check_references=args.check_refs,
+            strict_references=args.strict_refs,
+            only=selection.read_patterns(args.only) if args.only is not None else None,
+            render_time_budget=args.render_time_budget,
+            render_size_budget=args.render_size_budget,
+            budget_fail_fast=args.budget_fail_fast,
         )
 
-        constructor.construct(
-            cast(ConstructorContext, args.ctx), args.output_dir)
+        constructor.tracer = getattr(args, "tracer", None)
+
+        return constructor
+
+    def construct(self, constructor: JinjaConstructor, args: Namespace):
+        """
+        **Constructs** the documentation of `args.ctx` inside the
+        `args.output_dir` with the `constructor`.
+
+        If `--trace` was given, the **spans** recorded by the `constructor`
+        are **written** afterwards, even if the construction **fails**.
+        """
+
+        ctx = cast(ConstructorContext, args.ctx)
+
+        try:
+            enrichment = None
+
+            if getattr(args, "snapshot_dir", None) is not None:
+                enrichment = self.load_enrichment(args, constructor, ctx)
+
+            constructor.construct(ctx, args.output_dir, enrichment)
+        finally:
+            if constructor.tracer is not None and args.trace is not None:
+                constructor.tracer.write(args.trace)
+
+    def load_enrichment(self, args: Namespace, constructor: JinjaConstructor, ctx: ConstructorContext):
+        """
+        **Returns** the `Enrichment` of the `ctx` from the **snapshot**
+        in `args.snapshot`, if it was **derived** with the **same filters**
+        and has the **labels**, in case the `constructor` needs them.
+
+        Else, the enrichment is **derived** by the `constructor` and
+        **saved** along with the `ctx` as a **snapshot** for later runs
+        (before **construction**, since builders add data to the `ctx`).
+        """
+
+        cached: snapshot.Snapshot | None = getattr(args, "snapshot", None)
+
+        enrichment_key = constructor.get_enrichment_key()
+
+        if (
+            cached is not None
+            and cached["enrichment"] is not None
+            and cached["enrichment_key"] == enrichment_key
+            and (cached["enrichment"]["labels"] is not None or not constructor.needs_labels())
+        ):
+            return cached["enrichment"]
+
+        enrichment = constructor.enrich(ctx)
+
+        key = getattr(args, "snapshot_key", None)
+
+        if key is None:
+            key = snapshot.get_key(
+                args.input_dir, args.options_file, args.translator)
+
+        snapshot.write(snapshot.get_path(args.snapshot_dir, key), {
+            "version": snapshot.SNAPSHOT_VERSION,
+            "context": ctx,
+            "enrichment_key": enrichment_key,
+            "enrichment": enrichment,
+        })
+
+        return enrichment
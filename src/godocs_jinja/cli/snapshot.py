@@ -0,0 +1,113 @@
+import hashlib
+import pickle
+from importlib.metadata import PackageNotFoundError, version
+from os import PathLike
+from pathlib import Path
+from typing import TypedDict
+
+from godocs.constructor.constructor import ConstructorContext
+from godocs_jinja.constructor import Enrichment, manifest
+
+SNAPSHOT_VERSION = 2
+"""
+The version of the **snapshot** format, **bumped** whenever its
+structure changes so that **old snapshots** are **ignored**.
+"""
+
+PICKLE_PROTOCOL = 5
+"""
+The `pickle` protocol used to **store** snapshots.
+"""
+
+
+class Snapshot(TypedDict):
+    version: int
+    context: ConstructorContext
+    enrichment_key: str | None
+    enrichment: Enrichment | None
+
+
+def get_sources(input_dir: str | PathLike[str]) -> list[Path]:
+    """
+    **Returns** the **XML** files the core pipeline **parses** from the
+    `input_dir`: the file itself, or the `.xml` files inside the directory.
+    """
+
+    path = Path(input_dir)
+
+    if path.is_file():
+        return [path]
+
+    return sorted(path.glob("*.xml"))
+
+
+def get_key(
+    input_dir: str | PathLike[str],
+    options_file: str | PathLike[str] | None,
+    translator: str,
+) -> str:
+    """
+    **Returns** the **key** of the snapshot of the context created from the
+    given **arguments**, **hashing** the **contents** of the **XML** sources,
+    of the `options_file` and of the `translator` (if it's a script), as well
+    as the installed `godocs` **version**.
+    """
+
+    digest = hashlib.sha256()
+
+    try:
+        digest.update(version("godocs").encode())
+    except PackageNotFoundError:
+        pass
+
+    digest.update(b"\0" + translator.encode())
+
+    files = get_sources(input_dir)
+
+    if options_file is not None:
+        files.append(Path(options_file))
+    if Path(translator).is_file():
+        files.append(Path(translator))
+
+    for file in files:
+        digest.update(b"\0" + file.name.encode() + b"\0")
+        digest.update(file.read_bytes())
+
+    return digest.hexdigest()
+
+
+def get_path(snapshot_dir: str | PathLike[str], key: str) -> Path:
+    """
+    **Returns** the **path** of the snapshot with the `key` inside the
+    `snapshot_dir`.
+    """
+
+    return Path(snapshot_dir) / f"{key}.pickle"
+
+
+def read(path: Path) -> Snapshot | None:
+    """
+    **Reads** the snapshot in `path`, returning `None` if it's missing,
+    unreadable or from another `SNAPSHOT_VERSION`.
+    """
+
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+
+    return snapshot  # type: ignore
+
+
+def write(path: Path, snapshot: Snapshot) -> None:
+    """
+    **Writes** the `snapshot` to `path` through a temporary file, so that
+    concurrent runs never read a partially written snapshot.
+    """
+
+    manifest.write_atomic(
+        path, pickle.dumps(snapshot, protocol=PICKLE_PROTOCOL))
@@ -1,3 +1,28 @@
-from .constructor import JinjaConstructor, Builder
+from .constructor import JinjaConstructor, Builder, AsyncBuilder, Enrichment
+from .budget import Budget, BudgetExceededError
+from .changeset import Changeset
+from .extensions import FragmentCache, FragmentCacheExtension
+from .inventory import Inventory
+from .loader import SnapshotLoader
+from .observer import Observer
+from .progress import Progress
+from .references import References
+from .trace import Tracer
 
-__all__ = ["JinjaConstructor", "Builder"]
+__all__ = [
+    "JinjaConstructor",
+    "Builder",
+    "AsyncBuilder",
+    "Enrichment",
+    "Budget",
+    "BudgetExceededError",
+    "Changeset",
+    "FragmentCache",
+    "FragmentCacheExtension",
+    "Inventory",
+    "SnapshotLoader",
+    "Observer",
+    "Progress",
+    "References",
+    "Tracer",
+]
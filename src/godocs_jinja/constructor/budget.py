@@ -0,0 +1,209 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterator, TextIO, TypedDict
+from jinja2 import Template
+
+from godocs.constructor.constructor import ConstructorContext
+
+
+class Breach(TypedDict):
+    template: str
+    document: str
+    class_name: str | None
+    reason: str
+
+
+class BudgetExceededError(RuntimeError):
+    """
+    **Raised** when rendering a **document** exceeds a `Budget`
+    that `fail_fast`.
+    """
+
+
+class Budget:
+    """
+    **Limits** on the **time** and **output size** of the rendering of each
+    **document**, **checked** between the **chunks** a template **streams**,
+    so that a **runaway** template or filter is **stopped** as soon as it
+    **yields** output past them.
+
+    A document **exceeding** them is **aborted** (not written, and its
+    file from a **previous** construction **removed**, so that it isn't
+    published **stale**) and **reported** to the `stream`, or, if
+    `fail_fast`, the **construction** is **stopped** with a
+    `BudgetExceededError`.
+
+    A single **filter** call that never **returns** can't be interrupted,
+    but the **breach** is caught as soon as it does.
+    """
+
+    time: float | None
+    """
+    The **maximum** number of **seconds** rendering a **document** can take.
+    """
+
+    size: int | None
+    """
+    The **maximum** number of **characters** a **document** can have.
+    """
+
+    fail_fast: bool
+    """
+    Whether a **breach** stops the **construction**, instead of just
+    **aborting** the document.
+    """
+
+    stream: TextIO
+    """
+    The **stream** breaches are **reported** to.
+    """
+
+    breaches: list[Breach]
+    """
+    The **breaches** found so far.
+    """
+
+    def __init__(
+        self,
+        time: float | None = None,
+        size: int | None = None,
+        fail_fast: bool = False,
+        stream: TextIO | None = None,
+    ):
+        self.time = time
+        self.size = size
+        self.fail_fast = fail_fast
+        self.stream = stream if stream is not None else sys.stderr
+        self.breaches = []
+        self.lock = threading.Lock()
+
+    def check(self, started: float, size: int) -> str | None:
+        """
+        **Returns** why a **document** that started rendering at `started`
+        and has `size` characters so far **exceeds** this budget, if it does.
+        """
+
+        if self.size is not None and size > self.size:
+            return f"exceeded the size budget of {self.size} characters"
+
+        if self.time is not None and time.perf_counter() - started > self.time:
+            return f"exceeded the time budget of {self.time}s"
+
+        return None
+
+    def breach(self, template: Template, name: str, context: ConstructorContext, reason: str) -> None:
+        """
+        **Records** and **reports** that rendering the **document** with the
+        `name` from the `template` and `context` exceeded this budget for
+        the `reason` given, **raising** a `BudgetExceededError` if `fail_fast`.
+        """
+
+        class_data = context.get("class")
+        class_name = class_data.get("name") if isinstance(class_data, dict) else None
+
+        breach: Breach = {
+            "template": template.name or "",
+            "document": name,
+            "class_name": class_name,
+            "reason": reason,
+        }
+
+        origin = f" of class {class_name}" if class_name else ""
+        message = f"{breach['template']}: rendering {name}{origin} {reason}"
+
+        if self.fail_fast:
+            raise BudgetExceededError(message)
+
+        with self.lock:
+            self.breaches.append(breach)
+
+            self.stream.write(f"{message}, skipped\n")
+            self.stream.flush()
+
+    def discard(self, file: Path) -> None:
+        """
+        **Removes** the `file` of a **document** that exceeded this budget,
+        if a **previous** construction wrote it, **reporting** it.
+        """
+
+        try:
+            file.unlink()
+        except FileNotFoundError:
+            return
+
+        with self.lock:
+            self.stream.write(f"{file}: removed the document of a previous construction\n")
+            self.stream.flush()
+
+    def render(self, template: Template, name: str, context: ConstructorContext) -> str | None:
+        """
+        **Renders** the `template` with the `context` into the **document**
+        with the `name`, **streaming** it to **check** this budget.
+
+        Returns:
+            str | None: The **document**, or `None` if it exceeded this budget.
+        """
+
+        started = time.perf_counter()
+        chunks: list[str] = []
+        size = 0
+
+        for chunk in template.generate(context):
+            chunks.append(chunk)
+            size += len(chunk)
+
+            reason = self.check(started, size)
+
+            if reason is not None:
+                self.breach(template, name, context, reason)
+
+                return None
+
+        return "".join(chunks)
+
+    async def render_async(self, template: Template, name: str, context: ConstructorContext) -> str | None:
+        """
+        **Async** version of `render`.
+        """
+
+        started = time.perf_counter()
+        chunks: list[str] = []
+        size = 0
+
+        async for chunk in template.generate_async(context):
+            chunks.append(chunk)
+            size += len(chunk)
+
+            reason = self.check(started, size)
+
+            if reason is not None:
+                self.breach(template, name, context, reason)
+
+                return None
+
+        return "".join(chunks)
+
+
+current: ContextVar[Budget | None] = ContextVar("budget", default=None)
+"""
+The `Budget` of the **construction** currently **running**, if any, set by `use`.
+"""
+
+
+@contextmanager
+def use(budget: Budget | None) -> Iterator[None]:
+    """
+    **Sets** the `budget` as the `current` one while the returned
+    **context manager** is entered.
+    """
+
+    token = current.set(budget)
+
+    try:
+        yield
+    finally:
+        current.reset(token)
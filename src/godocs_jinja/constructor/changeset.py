@@ -0,0 +1,177 @@
+import json
+import threading
+from os import PathLike
+from pathlib import Path
+from typing import TypedDict
+
+from godocs.constructor.constructor import ConstructorContext
+
+from . import manifest
+from .observer import Observer
+
+type Hashes = dict[str, str]
+
+
+class Changes(TypedDict):
+    added: Hashes
+    modified: Hashes
+    unchanged: Hashes
+    removed: Hashes
+
+
+def get_output_hashes(root: Path, format: str, exclude: list[Path]) -> Hashes:
+    """
+    **Returns** the **hashes** of the **documents** with the `format`
+    extension inside the `root` directory, by their **paths** relative to
+    it, leaving out **hidden** files and the ones in `exclude`.
+    """
+
+    hashes: Hashes = {}
+
+    if not root.is_dir():
+        return hashes
+
+    for file in sorted(root.rglob(f"*.{format}")):
+        relative = file.relative_to(root)
+
+        if (
+            not file.is_file()
+            or file in exclude
+            or any(part.startswith(".") for part in relative.parts)
+        ):
+            continue
+
+        hashes[relative.as_posix()] = manifest.hash_file(file)
+
+    return hashes
+
+
+def read(path: Path) -> Hashes | None:
+    """
+    **Returns** the **hashes** of the files a **changeset** in `path` says
+    the **output** had after its **construction** (the ones **added**,
+    **modified** or **unchanged**), or `None` if it can't be read.
+    """
+
+    try:
+        changes: Changes = json.loads(path.read_text(encoding="utf-8"))
+
+        return {**changes["unchanged"], **changes["modified"], **changes["added"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+class Changeset(Observer):
+    """
+    An `Observer` that **writes** a **changeset** of a **construction** to a
+    **JSON** file: the **paths** (relative to the output path) of the files
+    **added**, **modified**, **unchanged** and **removed**, each mapped to the
+    **hash** of its **contents**, so that **deploys** can sync just the **delta**.
+
+    Files are **compared** with the **changeset** of the previous construction,
+    if the file already **exists**, or else with the **documents** of the
+    `format` **found** in the output path before **constructing**, so that
+    other files kept there (such as a `conf.py`) aren't taken as **removed**.
+    """
+
+    path: Path
+    """
+    The **path** of the **changeset file** written.
+    """
+
+    format: str
+    """
+    The **format** (file extension) of the **documents** constructed.
+    """
+
+    partial: bool
+    """
+    Whether the **construction** only **builds** some of the files, so that
+    the **previous** files not **written** are **unchanged** rather
+    than **removed**, if they're still there.
+    """
+
+    previous: Hashes
+    """
+    The **hashes** of the files in the output before the **construction**.
+    """
+
+    written: Hashes
+    """
+    The **hashes** of the files **written** so far.
+    """
+
+    root: Path | None = None
+    """
+    The **output path** of the **construction**, which file **paths**
+    are **relative** to.
+    """
+
+    def __init__(self, path: str | PathLike[str], partial: bool = False, format: str = "rst"):
+        self.path = Path(path)
+        self.partial = partial
+        self.format = format
+        self.previous = {}
+        self.written = {}
+        self.lock = threading.Lock()
+
+    def get_changes(self) -> Changes:
+        """
+        **Returns** the **changes** of the files **written** so far
+        in relation to the `previous` ones.
+        """
+
+        changes: Changes = {
+            "added": {}, "modified": {}, "unchanged": {}, "removed": {}}
+
+        with self.lock:
+            written = dict(self.written)
+
+        for file, hash in written.items():
+            previous = self.previous.get(file)
+
+            if previous is None:
+                changes["added"][file] = hash
+            elif previous != hash:
+                changes["modified"][file] = hash
+            else:
+                changes["unchanged"][file] = hash
+
+        for file, hash in self.previous.items():
+            if file in written:
+                continue
+
+            # Partial constructions keep the files they don't build,
+            # unless they're removed (such as when over a budget)
+            kept = self.partial and self.root is not None and (self.root / file).exists()
+
+            changes["unchanged" if kept else "removed"][file] = hash
+
+        return {
+            status: dict(sorted(hashes.items()))  # type: ignore
+            for status, hashes in changes.items()
+        }
+
+    def construct_started(self, context: ConstructorContext, path: str | PathLike[str]) -> None:
+        self.root = Path(path)
+        self.written = {}
+
+        previous = read(self.path)
+
+        if previous is None:
+            previous = get_output_hashes(self.root, self.format, [self.path])
+
+        self.previous = previous
+
+    def page_written(self, file: Path, content: str, context: ConstructorContext) -> None:
+        if self.root is not None and file.is_relative_to(self.root):
+            file = file.relative_to(self.root)
+
+        hash = manifest.hash_bytes(content.encode("utf-8"))
+
+        with self.lock:
+            self.written[file.as_posix()] = hash
+
+    def construct_finished(self, context: ConstructorContext, path: str | PathLike[str]) -> None:
+        manifest.write_atomic(
+            self.path, json.dumps(self.get_changes(), indent=2).encode("utf-8"))
@@ -1,16 +1,52 @@
+import asyncio
+import inspect
+from contextlib import nullcontext
+from functools import partial
+from importlib.metadata import PackageNotFoundError, version
 from os import PathLike
 from pathlib import Path
 from types import FunctionType
-from typing import Callable
+from typing import Awaitable, Callable, ContextManager, TypedDict
 from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 
 from godocs.util import dir, module
 from godocs.constructor import Constructor
 from godocs.constructor.constructor import ConstructorContext
 
+from . import budget, inventory, manifest, observer, selection, toc, trace
+from .budget import Budget
+from .changeset import Changeset
+from .extensions import DEFAULT_FRAGMENT_CACHE_SIZE, FragmentCache, FragmentCacheExtension
+from .inheritance import Inheritance, get_inheritance
+from .inventory import Inventory, Labels
+from .loader import SnapshotLoader
+from .manifest import Manifest, ScriptEntry
+from .observer import Observer
+from .progress import Progress
+from .references import References
+from .trace import Tracer
+
 type Builder = Callable[[
     str, Template, ConstructorContext, str | PathLike[str]], None]
 
+type AsyncBuilder = Callable[[
+    str, Template, ConstructorContext, str | PathLike[str]], Awaitable[None]]
+
+
+
+class Enrichment(TypedDict):
+    """
+    Data **derived** from a `ConstructorContext` by a `JinjaConstructor`
+    before **rendering** it, which only **changes** if the context or
+    the **filters** change, and thus can be **cached** along with the context.
+
+    The `labels` are only **derived** when **needed** (see `needs_labels`).
+    """
+
+    labels: Labels | None
+    inheritance: dict[str, Inheritance]
+
+
 MODELS_PATH = Path(__file__).parent / "models"
 """
 The path to the directory containing the built-in **models** available for the `JinjaConstructor`.
@@ -29,6 +65,26 @@ The default file format generated by the
 `JinjaConstructor`, which is set to `rst`.
 """
 
+DEFAULT_CLASS_PAGE_SIZE = 200
+"""
+The default **maximum** number of **members** documented in a single
+**class page** by the `build_paginated_class_templates` builder,
+which is set to `200`.
+"""
+
+DEFAULT_ASYNC_CONCURRENCY = 8
+"""
+The default **maximum** number of **documents** rendered at the same
+time by the **async builders**, which is set to `8`.
+"""
+
+CLASS_PAGE_SECTIONS = ["constants", "enums", "signals", "properties", "methods"]
+"""
+The **member sections** of a **class** that are **split** between pages
+by the `build_paginated_class_templates` builder, in the **order** they
+appear in the documentation.
+"""
+
 
 class JinjaConstructor(Constructor):
     """
@@ -91,11 +147,12 @@ class JinjaConstructor(Constructor):
     this class, or from the `filters_path` passed to the **constructor**.
     """
 
-    builders: dict[str, Builder] = {}
+    builders: dict[str, Builder | AsyncBuilder] = {}
     """
     A `dict` with the **builders** this **constructor** should use.
     The **keys** here are the **names** of the `Builders`, and the
-    **values** are the **builders themselves**.
+    **values** are the **builders themselves**, which can also be
+    `AsyncBuilders` when `enable_async` is set.
 
     The **names** are important since they are what **link** what
     `templates` are gonna be passed to what **builders**.
@@ -109,6 +166,132 @@ class JinjaConstructor(Constructor):
 
     output_format: str = DEFAULT_FORMAT
 
+    cache_path: Path | None = None
+    """
+    A **path** for a **directory** where this constructor keeps a **manifest**
+    of its **model** and the **bytecode** of its **scripts**, so that later
+    runs can **skip** discovering **templates** and **compiling** scripts.
+    """
+
+    filters_path: Path | None = None
+    """
+    The **path** of the **script** the `filters` were **loaded** from.
+    """
+
+    frozen_templates: bool = False
+    """
+    Whether the **templates** of this constructor are **read** into
+    **memory** once, instead of being **checked** for changes every
+    time they're **loaded** or **included**.
+    """
+
+    class_page_size: int | None = None
+    """
+    The **maximum** number of **members** in a single **class page**.
+    If set, the default `class` builder **splits** bigger classes into
+    **multiple pages**.
+    """
+
+    index_fan_out: int | None = None
+    """
+    The **maximum** number of **entries** in the `toctree` of a single
+    **index page**. If set, the default `index` builder **builds** a **tree**
+    of index pages, grouped as set by `index_grouping`.
+    """
+
+    index_grouping: str = "alphabet"
+    """
+    How **classes** are **grouped** into **index pages** when
+    `index_fan_out` is set, one of `toc.GROUPINGS`.
+    """
+
+    enable_async: bool = False
+    """
+    Whether the **Jinja environment** of this constructor is **created**
+    with `enable_async`, allowing **builders** to be `AsyncBuilders`.
+    """
+
+    async_concurrency: int = DEFAULT_ASYNC_CONCURRENCY
+    """
+    The **maximum** number of **documents** the default **async builders**
+    render at the **same time**.
+    """
+
+    fragment_cache: FragmentCache | None = None
+    """
+    The `FragmentCache` storing the **fragments** rendered by the
+    `{% cache %}` **blocks** of the **templates** of this constructor.
+    """
+
+    tracer: Tracer | None = None
+    """
+    The `Tracer` recording **spans** of the **setup** and **constructions**
+    of this constructor, if any.
+    """
+
+    inventory_path: Path | None = None
+    """
+    A **path** for a **file** where an **inventory** of the **labels** of
+    every **class** and **member** documented is **written** on construction.
+    """
+
+    changeset_path: Path | None = None
+    """
+    A **path** for a **JSON** file where the **changeset** of each
+    **construction** (the output files **added**, **modified**, **unchanged**
+    and **removed**, with their **hashes**) is **written**.
+    """
+
+    progress: bool = False
+    """
+    Whether the **progress** of **constructions** is **reported** to `stderr`.
+    """
+
+    progress_report_path: Path | None = None
+    """
+    A **path** for a **JSON Lines** file where a **summary** of each
+    **construction** is appended.
+    """
+
+    check_references: bool = False
+    """
+    Whether **references** whose **targets** aren't written by a
+    **construction** are **reported** to `stderr`.
+    """
+
+    strict_references: bool = False
+    """
+    Whether **constructions** **fail** when some **references** have no
+    **target**. Setting it also enables `check_references`.
+    """
+
+    only: list[str] | None = None
+    """
+    **Names** or **glob patterns** of the **classes** to build.
+    If set, **constructions** only **build** the `class` template for the
+    **matching** classes, the `index` template only if what it **depends**
+    on **changed**, and **skip** every other template.
+    """
+
+    render_time_budget: float | None = None
+    """
+    The **maximum** number of **seconds** rendering a single **document**
+    can take before it's **aborted**.
+    """
+
+    render_size_budget: int | None = None
+    """
+    The **maximum** number of **characters** a single **document** can
+    have before it's **aborted**.
+    """
+
+    budget_fail_fast: bool = False
+    """
+    Whether a **document** exceeding the `render_time_budget` or
+    `render_size_budget` **stops** the **construction**, instead of just
+    being **skipped**.
+    """
+
     @staticmethod
     def build_template(
         name: str,
@@ -124,16 +307,41 @@ class JinjaConstructor(Constructor):
         This method **expects** a `template` that's used to create its
         result, with the use of the data inside the `context`, that
         also needs to be **supplied**.
+
+        The `Observers` of the **construction** running, if any, are
+        **notified** about the written document.
+        If the **construction** has a `Budget`, the document is **streamed**
+        to **check** it, and **skipped** if it's **exceeded** (removing the
+        one written by a **previous** construction, if any).
         """
 
         path = Path(path)
 
-        result = template.render(context)
+        limits = budget.current.get()
 
-        if not path.exists():
-            path.mkdir(parents=True, exist_ok=True)
+        with trace.span("render", "render", document=name):
+            if limits is None:
+                result = template.render(context)
+            else:
+                result = limits.render(template, name, context)
+
+        file = path.joinpath(f"{name}.{format}")
+
+        if result is None:
+            # Only budgets abort renders
+            assert limits is not None
+
+            limits.discard(file)
+
+            return
 
-        path.joinpath(f"{name}.{format}").write_text(result)
+        with trace.span("write", "io", file=str(file)):
+            if not path.exists():
+                path.mkdir(parents=True, exist_ok=True)
+
+            file.write_text(result)
+
+        observer.notify("page_written", file, result, context)
 
     @staticmethod
     def build_class_templates(
@@ -150,12 +358,228 @@ class JinjaConstructor(Constructor):
         same **classes**.
         """
 
+        observer.notify("pages_expected", len(context["classes"]))
+
         for class_data in context["classes"]:
             context["class"] = class_data
 
             JinjaConstructor.build_template(
                 class_data["name"], format, template, context, path)
 
+    @staticmethod
+    async def build_template_async(
+        name: str,
+        format: str,
+        template: Template,
+        context: ConstructorContext,
+        path: str | PathLike[str],
+    ) -> None:
+        """
+        **Async** version of `build_template`, that **awaits** the **rendering**
+        of a `template` from an `Environment` with `enable_async` and
+        **writes** the output **document** in a **worker thread**, so that
+        other **documents** can be **rendered** meanwhile.
+        """
+
+        path = Path(path)
+
+        limits = budget.current.get()
+
+        with trace.span("render", "render", document=name):
+            if limits is None:
+                result = await template.render_async(context)
+            else:
+                result = await limits.render_async(template, name, context)
+
+        file = path.joinpath(f"{name}.{format}")
+
+        if result is None:
+            # Only budgets abort renders
+            assert limits is not None
+
+            limits.discard(file)
+
+            return
+
+        def write():
+            with trace.span("write", "io", file=str(file)):
+                path.mkdir(parents=True, exist_ok=True)
+
+                file.write_text(result)
+
+        await asyncio.to_thread(write)
+
+        observer.notify("page_written", file, result, context)
+
+    @staticmethod
+    async def build_class_templates_async(
+        format: str,
+        template: Template,
+        context: ConstructorContext,
+        path: str | PathLike[str],
+        concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    ) -> None:
+        """
+        **Async** version of `build_class_templates`, that **builds** up to
+        `concurrency` **class documents** at the **same time**.
+
+        Each class is **rendered** with a **copy** of the `context`
+        with its own `class` field.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        observer.notify("pages_expected", len(context["classes"]))
+
+        async def build(class_data: dict):
+            async with semaphore:
+                await JinjaConstructor.build_template_async(
+                    class_data["name"],
+                    format,
+                    template,
+                    {**context, "class": class_data},
+                    path,
+                )
+
+        await asyncio.gather(*(build(c) for c in context["classes"]))
+
+    @staticmethod
+    async def build_index_template_async(
+        format: str,
+        template: Template,
+        context: ConstructorContext,
+        path: str | PathLike[str],
+    ) -> None:
+        """
+        **Async** version of `build_index_template`.
+        """
+
+        observer.notify("pages_expected", 1)
+
+        await JinjaConstructor.build_template_async(
+            "index", format, template, context, path)
+
+    @staticmethod
+    def wrap_builder(builder: Builder | AsyncBuilder) -> AsyncBuilder:
+        """
+        **Returns** the `builder` itself if it's an `AsyncBuilder`, else an
+        `AsyncBuilder` that **runs** it in a **worker thread**, where its
+        **synchronous** calls to `Template.render` are allowed.
+        """
+
+        if inspect.iscoroutinefunction(builder):
+            return builder
+
+        async def wrapper(
+            format: str,
+            template: Template,
+            context: ConstructorContext,
+            path: str | PathLike[str],
+        ) -> None:
+            await asyncio.to_thread(builder, format, template, context, path)
+
+        return wrapper
+
+    @staticmethod
+    def paginate_class(class_data: dict, page_size: int) -> list[dict]:
+        """
+        **Splits** the **members** of the `class_data` among **copies** of it
+        with at most `page_size` **members** each (an **enum** counts as
+        one member plus its values).
+
+        Members are **distributed** in the order of `CLASS_PAGE_SECTIONS`,
+        and each copy only keeps the **members** that fall **into it**.
+
+        Returns:
+            list[dict]: The `class_data` itself, if it fits in a single page,
+            else its **copies**, one per **page**.
+        """
+
+        pages: list[dict] = []
+        page: dict = {}
+        size = 0
+
+        for section in CLASS_PAGE_SECTIONS:
+            for member in class_data.get(section) or []:
+                weight = 1
+
+                if section == "enums":
+                    weight += len(member.get("values") or [])
+
+                if not page or size > 0 and size + weight > page_size:
+                    page = {**class_data, **{s: [] for s in CLASS_PAGE_SECTIONS}}
+                    pages.append(page)
+                    size = 0
+
+                page[section].append(member)
+                size += weight
+
+        if len(pages) <= 1:
+            return [class_data]
+
+        return pages
+
+    @staticmethod
+    def build_paginated_class_templates(
+        format: str,
+        template: Template,
+        context: ConstructorContext,
+        path: str | PathLike[str],
+        page_size: int = DEFAULT_CLASS_PAGE_SIZE,
+    ) -> None:
+        """
+        **Builds** output **documents** for all `classes` specified
+        in the `classes` field of the `context`, like the
+        `build_class_templates` builder, but **splitting** classes with
+        more than `page_size` **members** into multiple **documents**.
+
+        A class that is **split** gets an **overview** document named after it
+        and **member** documents named `<class>-<number>`.
+        While rendering them, the `context` has a `page` field with the
+        `number` of the page (`0` for the overview), the `count` of member
+        pages and the names of the member `pages`, so that **templates** can
+        pick what to **show** and link the **pages** in a `toctree`.
+        """
+
+        paginated = [
+            (class_data, JinjaConstructor.paginate_class(class_data, page_size))
+            for class_data in context["classes"]
+        ]
+
+        observer.notify("pages_expected", sum(
+            len(pages) + (1 if len(pages) > 1 else 0) for _, pages in paginated))
+
+        for class_data, pages in paginated:
+            context["class"] = class_data
+
+            if len(pages) == 1:
+                context.pop("page", None)
+
+                JinjaConstructor.build_template(
+                    class_data["name"], format, template, context, path)
+
+                continue
+
+            names = [
+                f"{class_data['name']}-{number}"
+                for number in range(1, len(pages) + 1)
+            ]
+
+            context["page"] = {"number": 0, "count": len(pages), "pages": names}
+
+            JinjaConstructor.build_template(
+                class_data["name"], format, template, context, path)
+
+            for number, page in enumerate(pages, 1):
+                context["class"] = page
+                context["page"] = {
+                    "number": number, "count": len(pages), "pages": names}
+
+                JinjaConstructor.build_template(
+                    names[number - 1], format, template, context, path)
+
+        context.pop("page", None)
+
     @staticmethod
     def build_index_template(
         format: str,
@@ -171,9 +595,49 @@ class JinjaConstructor(Constructor):
         **extension** from `OUTPUT_FORMAT`.
         """
 
+        observer.notify("pages_expected", 1)
+
         JinjaConstructor.build_template(
             "index", format, template, context, path)
 
+    @staticmethod
+    def build_index_tree_templates(
+        format: str,
+        template: Template,
+        context: ConstructorContext,
+        path: str | PathLike[str],
+        fan_out: int = toc.DEFAULT_INDEX_FAN_OUT,
+        grouping: str = "alphabet",
+    ) -> None:
+        """
+        **Builds** a **tree** of output **documents** meant to **index** the
+        **classes** documented, instead of the single one `build_index_template`
+        builds, so that no `toctree` lists more than `fan_out` **entries**.
+
+        Classes are **grouped** by their names' **letters**, **namespaces**
+        or **parents**, according to the `grouping` (one of `toc.GROUPINGS`),
+        working only on their **names** and **parents**. The **root** document
+        is named `index`, and the others `index-<group>` or
+        `index-<group>-part<number>`.
+        While rendering them, the `context` has an `index` field with the
+        `name`, `title` and `entries` (documents in its `toctree`) of the
+        page, and whether it's the `root` one.
+        """
+
+        classes = [
+            (class_data["name"], list(class_data.get("parents") or []))
+            for class_data in context["classes"]
+        ]
+
+        pages = toc.get_pages(
+            toc.group_classes(classes, grouping, fan_out), fan_out)
+
+        observer.notify("pages_expected", len(pages))
+
+        for page in pages:
+            JinjaConstructor.build_template(
+                page["name"], format, template, {**context, "index": page}, path)
+
     def __init__(
         self,
         model: str | PathLike[str] | None = None,
@@ -181,11 +645,24 @@ class JinjaConstructor(Constructor):
         filters_path: str | PathLike[str] | None = None,
         builders_path: str | PathLike[str] | None = None,
         output_format: str = DEFAULT_FORMAT,
+        cache_path: str | PathLike[str] | None = None,
+        frozen_templates: bool = False,
+        class_page_size: int | None = None,
+        index_fan_out: int | None = None,
+        index_grouping: str = "alphabet",
+        enable_async: bool = False,
+        async_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+        fragment_cache_size: int = DEFAULT_FRAGMENT_CACHE_SIZE,
+        fragment_cache_path: str | PathLike[str] | None = None,
+        tracer: Tracer | None = None,
     ):
         """
         Instantiates a new `JinjaConstructor` with several optional customizations
         through parameters.
 
+        The options of its **constructions** (such as an **inventory** or
+        **budgets**) are set afterwards, by `configure`.
+
         Parameters:
             model: the **name** of the built-in **model** this constructor
                    should use or a **path** to a custom **model**.
@@ -209,9 +686,64 @@ class JinjaConstructor(Constructor):
                       which builds one output file for each class in the docs -
                       and an `index` template - which renders one file with an index for
                       all others.
+            output_format: the **file extension** of the generated documents.
+            cache_path: a **path** to a **directory** where a **manifest** of the
+                        **templates**, **filters** and **builders** is stored,
+                        along with the **compiled bytecode** of their scripts.
+                        When set, setup **reads** the manifest instead of walking
+                        the **model**, refreshing it whenever it's **outdated**.
+                        By default, no cache is used.
+            frozen_templates: whether the **templates** should be **read** into
+                              **memory** at **construction**, with no further
+                              **up-to-date checks** while rendering.
+                              Useful for **batch runs**, where templates don't change.
+                              By default, templates are **reloaded** when modified.
+            class_page_size: the **maximum** number of **members** documented
+                             in a single **class page** by the default `class` builder.
+                             **Classes** with **more members** are split into an
+                             **overview** page and **member** pages.
+                             By default, classes are **never split**.
+            index_fan_out: the **maximum** number of **entries** in the `toctree`
+                           of a single **index page** built by the default `index`
+                           builder, which then builds a **tree** of index pages
+                           with the **classes** grouped as set by `index_grouping`.
+                           Must be at least `2`.
+                           By default, a single **index** lists all classes.
+            index_grouping: how **classes** are **grouped** into **index pages**:
+                            by the **letters** starting their names (`alphabet`),
+                            by the **namespaces** in their names (`namespace`)
+                            or by their **parents** (`parents`).
+                            By default, they're grouped by `alphabet`.
+            enable_async: whether the **Jinja environment** should be created
+                          with `enable_async`, so that **builders** can be **async
+                          functions** (`AsyncBuilders`) that `await`
+                          `Template.render_async`. **Sync builders** are then run
+                          in **worker threads**, and the default builders
+                          **render** classes **concurrently**.
+                          By default, **builders** are run **synchronously**.
+            async_concurrency: the **maximum** number of **documents** the default
+                               **async builders** render at the **same time**.
+                               Must be at least `1`.
+            fragment_cache_size: the **maximum** number of **fragments** rendered by
+                                 `{% cache key, ... %}` **blocks** kept in **memory**.
+            fragment_cache_path: a **path** to a **directory** where **fragments**
+                                 rendered by `{% cache %}` **blocks** are also **stored**,
+                                 so that they're **reused** by later runs with the same
+                                 **filters** and `godocs-jinja` **version** (each
+                                 combination gets its own **subdirectory**).
+                                 By default, fragments are only kept in **memory**.
+            tracer: a `Tracer` to record **spans** of the **setup** steps,
+                    **builders**, **renders** and **writes** of this constructor.
+                    By default, nothing is recorded.
         """
 
-        self.models = self.find_models(MODELS_PATH)
+        self.tracer = tracer
+
+        # With a cache, the built-in models aren't walked, the model
+        # named is looked for directly instead
+        if cache_path is None:
+            with self.span("find_models"):
+                self.models = self.find_models(MODELS_PATH)
 
         # model is either rst by default, or a built-in model
         # by name or a custom model by path
@@ -229,33 +761,257 @@ class JinjaConstructor(Constructor):
 
         self.templates_path = Path(templates_path)
 
-        self.templates = self.find_templates(self.templates_path)
-
         # filters_path is either got from the model by default or
         # is got from the argument
         if filters_path is None:
             filters_path = self.model / "filters.py"
 
-        self.filters = self.load_filters(Path(filters_path))
+        self.filters_path = Path(filters_path)
 
-        # builders are either got from the builders_path or set
-        # to the default builders
-        if builders_path is not None:
-            self.builders = dict(self.load_builders(Path(builders_path)))
+        self.class_page_size = class_page_size
+
+        if index_grouping not in toc.GROUPINGS:
+            raise ValueError(
+                f'unknown index grouping "{index_grouping}", expected one of {toc.GROUPINGS}')
+
+        if index_fan_out is not None and index_fan_out < 2:
+            raise ValueError(
+                f"index_fan_out must be at least 2, got {index_fan_out}")
+
+        self.index_fan_out = index_fan_out
+        self.index_grouping = index_grouping
+
+        if async_concurrency < 1:
+            raise ValueError(
+                f"async_concurrency must be at least 1, got {async_concurrency}")
+
+        self.enable_async = enable_async
+        self.async_concurrency = async_concurrency
+
+        if cache_path is not None:
+            self.cache_path = Path(cache_path)
+
+            with self.span("load_cached"):
+                self.load_cached(
+                    self.cache_path,
+                    Path(filters_path),
+                    Path(builders_path) if builders_path is not None else None,
+                )
         else:
-            self.builders = {
-                "class": JinjaConstructor.build_class_templates,
-                "index": JinjaConstructor.build_index_template,
-            }
+            with self.span("find_templates"):
+                self.templates = self.find_templates(self.templates_path)
 
-        self.env = Environment(
-            loader=FileSystemLoader(self.templates_path),
-            autoescape=select_autoescape()
-        )
-        self.register_filters(self.env, self.filters)
+            with self.span("load_filters"):
+                self.filters = self.load_filters(Path(filters_path))
+
+            # builders are either got from the builders_path or set
+            # to the default builders
+            if builders_path is not None:
+                with self.span("load_builders"):
+                    self.builders = dict(
+                        self.load_builders(Path(builders_path)))
+            else:
+                self.builders = self.get_default_builders()
+
+        self.frozen_templates = frozen_templates
+
+        with self.span("create_env"):
+            self.env = self.create_env(
+                self.templates_path, frozen_templates, enable_async)
+            self.register_filters(self.env, self.filters)
+
+        # Stored fragments are only reused with the same filters and package
+        if fragment_cache_path is not None:
+            fragment_cache_path = Path(fragment_cache_path) / self.get_fragments_key()
+
+        self.fragment_cache = FragmentCache(
+            fragment_cache_size, fragment_cache_path)
+
+        self.env.fragment_cache = self.fragment_cache  # type: ignore
 
         self.output_format = output_format
 
+    def configure(
+        self,
+        inventory_path: str | PathLike[str] | None = None,
+        changeset_path: str | PathLike[str] | None = None,
+        progress: bool = False,
+        progress_report_path: str | PathLike[str] | None = None,
+        check_references: bool = False,
+        strict_references: bool = False,
+        only: list[str] | None = None,
+        render_time_budget: float | None = None,
+        render_size_budget: int | None = None,
+        budget_fail_fast: bool = False,
+    ) -> "JinjaConstructor":
+        """
+        **Sets** the options of this constructor that only **affect** its
+        **constructions**, not its **setup**, so that a constructor **set up**
+        once can be **reused** (or **copied**) for constructions with
+        **different** options. Options not given are **reset** to their defaults.
+
+        Parameters:
+            inventory_path: a **path** to a **file** where an **inventory**
+                            mapping every **class** and **member** to its
+                            **document** and **label** is written on construction.
+                            A `.inv` file gets a **Sphinx** `objects.inv`, usable by
+                            `intersphinx`, any other gets **JSON**.
+                            By default, no inventory is written.
+            changeset_path: a **path** to a **JSON** file where the **changeset** of
+                            each **construction** is written: the **paths** of the
+                            output files **added**, **modified**, **unchanged** and
+                            **removed**, mapped to the **hashes** of their contents.
+                            Files are **compared** with the previous **changeset**
+                            in the same path or, if there's none, with the
+                            **documents** of the `output_format` **found** in the
+                            output path. After an `only` construction, the files
+                            not **built** are **unchanged**, not **removed**.
+                            By default, no changeset is written.
+            progress: whether the **progress** of **constructions** (documents
+                      written, documents per second, bytes written and ETA)
+                      should be **reported** to `stderr`, as a **progress line** on
+                      terminals or as periodic **log lines** otherwise.
+                      By default, nothing is reported.
+            progress_report_path: a **path** to a **JSON Lines** file where a
+                                  **summary** of each **construction** is appended.
+                                  Setting it also enables `progress`.
+            check_references: whether the `:ref:` **references** written that have
+                              no **label target** (`.. _label:`) in any document
+                              of the **construction** should be **reported** to
+                              `stderr`, along with the **class** and **member**
+                              they were made in.
+                              By default, references aren't checked.
+            strict_references: whether **constructions** should **fail** with a
+                               `RuntimeError` when some **references** have no
+                               **target**. Setting it also enables `check_references`.
+            only: **names** or **glob patterns** of the **classes** to build,
+                  for **re-rendering** just the classes that **changed**.
+                  Only the `class` template is built, for the **matching**
+                  classes, along with the `index` template when the **options**
+                  or the **names** or **brief descriptions** of the classes
+                  changed since the last **selective** construction in the
+                  same **output** path (tracked in a **state** file there).
+                  Other templates are **skipped**.
+                  By default, every class and template is built.
+            render_time_budget: the **maximum** number of **seconds** rendering a
+                                single **document** can take. Documents are then
+                                **streamed**, and the ones **exceeding** it are
+                                **aborted** and **reported** to `stderr`, naming
+                                their **template** and **class**.
+                                By default, there's no limit.
+            render_size_budget: the **maximum** number of **characters** a single
+                                **document** can have, **enforced** the same way.
+                                By default, there's no limit.
+            budget_fail_fast: whether a **document** exceeding a **budget** should
+                              **stop** the **construction** with a
+                              `BudgetExceededError`, instead of being **skipped**.
+
+        Returns:
+            JinjaConstructor: This constructor.
+        """
+
+        self.inventory_path = Path(inventory_path) if inventory_path is not None else None
+        self.changeset_path = Path(changeset_path) if changeset_path is not None else None
+
+        self.progress = progress
+        self.progress_report_path = Path(
+            progress_report_path) if progress_report_path is not None else None
+
+        self.check_references = check_references
+        self.strict_references = strict_references
+
+        self.only = only
+
+        self.render_time_budget = render_time_budget
+        self.render_size_budget = render_size_budget
+        self.budget_fail_fast = budget_fail_fast
+
+        return self
+
+    def span(self, name: str, category: str = "setup", /, **args: object) -> ContextManager[None]:
+        """
+        **Records** a **span** with the `tracer` of this constructor, if
+        there's one, lasting while the returned **context manager** is entered.
+        """
+
+        if self.tracer is None:
+            return nullcontext()
+
+        return self.tracer.span(name, category, **args)
+
+    def create_env(self, templates_path: Path, frozen: bool = False, enable_async: bool = False) -> Environment:
+        """
+        **Creates** the **Jinja environment** that loads **templates** from
+        the `templates_path`.
+
+        If `frozen`, the templates are all **read** up front by a
+        `SnapshotLoader` and **never reloaded**, else a `FileSystemLoader`
+        **checks** them for **changes** whenever they're used.
+        If `enable_async`, templates can be **rendered** with `render_async`.
+
+        The `FragmentCacheExtension` is **registered** in it, so that templates
+        can use `{% cache key, ... %}...{% endcache %}` **blocks**.
+
+        Returns:
+            Environment: The **Jinja environment** created.
+        """
+
+        if frozen:
+            return Environment(
+                loader=SnapshotLoader(templates_path),
+                autoescape=select_autoescape(),
+                auto_reload=False,
+                enable_async=enable_async,
+                extensions=[FragmentCacheExtension],
+            )
+
+        return Environment(
+            loader=FileSystemLoader(templates_path),
+            autoescape=select_autoescape(),
+            enable_async=enable_async,
+            extensions=[FragmentCacheExtension],
+        )
+
+    def get_default_builders(self) -> dict[str, Builder | AsyncBuilder]:
+        """
+        **Returns** the `builders` used when no **builders script** is given:
+        the `class` builder, which builds one output file for each class
+        (or more, when `class_page_size` is set), and the `index` builder,
+        which builds one index file for all of them (or a tree of them,
+        when `index_fan_out` is set).
+
+        When `enable_async` is set, their **async** versions are used instead.
+        """
+
+        builders: dict[str, Builder | AsyncBuilder] = {
+            "class": JinjaConstructor.build_class_templates,
+            "index": JinjaConstructor.build_index_template,
+        }
+
+        if self.enable_async:
+            builders = {
+                "class": partial(
+                    JinjaConstructor.build_class_templates_async,
+                    concurrency=self.async_concurrency,
+                ),
+                "index": JinjaConstructor.build_index_template_async,
+            }
+
+        if self.class_page_size is not None:
+            builders["class"] = partial(
+                JinjaConstructor.build_paginated_class_templates,
+                page_size=self.class_page_size,
+            )
+
+        if self.index_fan_out is not None:
+            builders["index"] = partial(
+                JinjaConstructor.build_index_tree_templates,
+                fan_out=self.index_fan_out,
+                grouping=self.index_grouping,
+            )
+
+        return builders
+
     def find_models(self, path: Path) -> list[Path]:
         """
         **Returns** the paths of the **models inside** the `path` directory
@@ -278,8 +1034,16 @@ class JinjaConstructor(Constructor):
         Receives the `name` of a **model** to **look for** among the
         **default models** available and **returns** the `Path` for
         the found one, if not `None`.
+
+        If the `models` weren't **found** (as when a `cache_path` is used),
+        the model is **looked for** directly inside `MODELS_PATH`.
         """
 
+        if not self.models:
+            model = MODELS_PATH / name
+
+            return model if name != "__pycache__" and model.is_dir() else None
+
         for model in self.models:
             if model.stem == name:
                 return model
@@ -380,6 +1144,102 @@ class JinjaConstructor(Constructor):
 
         return module.get_functions(mod)
 
+    def load_cached_functions(
+        self,
+        name: str,
+        path: Path,
+        cache_path: Path,
+        cached: Manifest | None,
+    ) -> tuple[list[tuple[str, FunctionType]], ScriptEntry | None]:
+        """
+        **Loads** the **functions** from the **script** in the `path` reusing its
+        **cached bytecode** from the `cache_path` when the script didn't change.
+
+        If the `cached` manifest has an **entry** for the **same script**, the
+        functions are **picked** by the names it recorded instead of
+        **inspecting** the whole module.
+
+        Returns:
+            tuple[list[tuple[str, FunctionType]], ScriptEntry | None]: **Functions**
+            from the **script** and the **manifest entry** describing it.
+        """
+
+        if not path.exists():
+            return [], None
+
+        source = path.read_bytes()
+        hash = manifest.hash_bytes(source)
+
+        mod = manifest.load_module(name, path, source, hash, cache_path)
+
+        entry = manifest.get_script_entry(cached, name, path, hash)
+
+        if entry is None:
+            functions = module.get_functions(mod)
+        else:
+            functions = [(n, getattr(mod, n)) for n in entry["functions"]]
+
+        return functions, {
+            "path": str(path),
+            "hash": hash,
+            "functions": [f[0] for f in functions],
+        }
+
+    def load_cached(self, cache_path: Path, filters_path: Path, builders_path: Path | None):
+        """
+        **Sets up** the `templates`, `filters` and `builders` of this constructor
+        from the **manifest** kept in the `cache_path`.
+
+        **Templates** are only **searched** for again if the directories they were
+        found in **changed**, and **scripts** are **executed** from their
+        **cached bytecode** if their **hashes** match.
+        The **manifest** is **rewritten** whenever any of that is outdated.
+        """
+
+        if self.templates_path is None:
+            raise AttributeError("loading cache needs templates_path to be defined")
+
+        manifest_path = manifest.get_manifest_path(
+            cache_path, self.templates_path, filters_path, builders_path)
+
+        cached = manifest.read(manifest_path)
+
+        # The templates directory is only listed again when it changed
+        if cached is not None and manifest.is_templates_fresh(cached, self.templates_path):
+            self.templates = [Path(t) for t in cached["templates"]]
+            templates_mtimes = cached["templates_mtimes"]
+        else:
+            self.templates = self.find_templates(self.templates_path)
+            templates_mtimes = manifest.get_templates_mtimes(self.templates_path)
+
+        self.filters, filters_entry = self.load_cached_functions(
+            "filters", filters_path, cache_path, cached)
+
+        builders_entry = None
+
+        if builders_path is not None:
+            builders, builders_entry = self.load_cached_functions(
+                "builders", builders_path, cache_path, cached)
+
+            self.builders = dict(builders)
+        else:
+            self.builders = self.get_default_builders()
+
+        result: Manifest = {
+            "version": manifest.MANIFEST_VERSION,
+            "templates_path": str(self.templates_path),
+            "templates_mtimes": templates_mtimes,
+            "templates": [str(t) for t in self.templates],
+            "filters": filters_entry,
+            "builders": builders_entry,
+        }
+
+        if result != cached:
+            try:
+                manifest.write(manifest_path, result)
+            except OSError:
+                pass
+
     def register_filters(self, env: Environment, filters: list[tuple[str, FunctionType]]) -> Environment:
         """
         **Registers** the `functions` present in the `filters` argument as
@@ -395,21 +1255,342 @@ class JinjaConstructor(Constructor):
 
         return env
 
-    def build_templates(self, env: Environment, context: ConstructorContext, path: str | PathLike[str]):
+    def build_templates(
+        self,
+        env: Environment,
+        context: ConstructorContext,
+        path: str | PathLike[str],
+        contexts: dict[str, ConstructorContext] | None = None,
+    ):
+        """
+        **Runs** the **builder** of each **template** with the `context`.
+
+        If `contexts` is given, only the **templates** named in it are
+        **built**, each with the **context** it's mapped to.
+        """
+
+        if env.is_async:
+            asyncio.run(self.build_templates_async(env, context, path, contexts))
+
+            return
+
         for template_path in self.templates:
             builder = self.builders.get(template_path.stem)
 
             if builder is None:
                 continue
 
+            if contexts is not None:
+                if template_path.stem not in contexts:
+                    continue
+
+                context = contexts[template_path.stem]
+
             template_index = self.get_template_index(template_path)
 
             template = env.get_template(self.get_template_name(template_index))
 
-            builder(self.output_format, template, context, path)
+            observer.notify("builder_started", template_path.stem)
+
+            with trace.span("builder", "builder", template=template_path.stem):
+                builder(self.output_format, template, context, path)  # type: ignore
+
+            observer.notify("builder_finished", template_path.stem)
+
+    async def build_templates_async(
+        self,
+        env: Environment,
+        context: ConstructorContext,
+        path: str | PathLike[str],
+        contexts: dict[str, ConstructorContext] | None = None,
+    ):
+        """
+        **Async** version of `build_templates`, used when the `env` has
+        `enable_async`, which **awaits** each **builder** in turn,
+        **wrapping** the **sync** ones with `wrap_builder`.
+        """
+
+        for template_path in self.templates:
+            builder = self.builders.get(template_path.stem)
+
+            if builder is None:
+                continue
+
+            if contexts is not None:
+                if template_path.stem not in contexts:
+                    continue
+
+                context = contexts[template_path.stem]
+
+            template_index = self.get_template_index(template_path)
+
+            template = env.get_template(self.get_template_name(template_index))
+
+            observer.notify("builder_started", template_path.stem)
+
+            with trace.span("builder", "builder", template=template_path.stem):
+                await self.wrap_builder(builder)(self.output_format, template, context, path)
+
+            observer.notify("builder_finished", template_path.stem)
+
+    def get_labels(self, context: ConstructorContext) -> Labels:
+        """
+        **Returns** the **labels** of every **class** and **member** in the
+        `context`, made by the `make_code_member_label_target` and
+        `join_code_member_name` **filters** of the **model** with the
+        `ref_prefix` from the `options`.
+
+        If the **model** doesn't have those **filters**, no labels are known.
+
+        Returns:
+            Labels: **Labels** mapped to the **name** and **kind** of what they target.
+        """
+
+        if self.env is None:
+            return {}
+
+        make_label = self.env.filters.get("make_code_member_label_target")
+        join_name = self.env.filters.get("join_code_member_name")
+
+        if make_label is None or join_name is None:
+            return {}
+
+        options = context.get("options") or {}
+
+        return inventory.get_labels(
+            context.get("classes") or [],
+            options.get("ref_prefix") or "",
+            make_label,
+            join_name,
+        )
+
+    def needs_labels(self) -> bool:
+        """
+        **Returns** whether **constructions** need the **labels** of the
+        **classes** and **members**, that is, whether they write an
+        **inventory** or **check** references.
+        """
+
+        return (
+            self.inventory_path is not None
+            or self.check_references
+            or self.strict_references
+        )
+
+    def enrich(self, context: ConstructorContext) -> Enrichment:
+        """
+        **Derives** from the `context` the data this constructor needs
+        besides it to **render** documents, leaving out the `labels`
+        unless it `needs_labels`, since they **call** filters for
+        every **member**.
+
+        Returns:
+            Enrichment: The **data** derived from the `context`.
+        """
+
+        return {
+            "labels": self.get_labels(context) if self.needs_labels() else None,
+            "inheritance": get_inheritance(context.get("classes") or []),
+        }
+
+    def overlay(self, context: ConstructorContext, enrichment: Enrichment) -> ConstructorContext:
+        """
+        **Returns** a **copy** of the `context` where each **class** is
+        **overlaid** with its `inheritance` from the `enrichment`, so that
+        **templates** can read its **ancestors**, **known** and **unknown**
+        parents and **inherited** members as `class.inheritance` instead of
+        **walking** the hierarchy for every **page**.
+
+        The **classes** are **shallow copies**, so their **data** isn't copied.
+        """
+
+        inheritance = enrichment.get("inheritance") or {}
+
+        classes = [
+            {**class_data, "inheritance": inheritance[class_data["name"]]}
+            if class_data["name"] in inheritance else class_data
+            for class_data in context.get("classes") or []
+        ]
+
+        return {**context, "classes": classes}  # type: ignore
+
+    def get_enrichment_key(self) -> str:
+        """
+        **Returns** a **key** that **changes** whenever the `Enrichment` this
+        constructor derives from the **same context** could change, that is,
+        whenever its **filters** script changes.
+        """
+
+        if self.filters_path is None or not self.filters_path.exists():
+            return ""
+
+        return manifest.hash_file(self.filters_path)
+
+    def get_fragments_key(self) -> str:
+        """
+        **Returns** a **key** that **changes** whenever the **fragments** this
+        constructor renders for the **same** `{% cache %}` **block** and **keys**
+        could change, that is, whenever its **filters** script or the installed
+        `godocs-jinja` **version** change.
+        """
+
+        try:
+            package = version("godocs-jinja")
+        except PackageNotFoundError:
+            package = ""
+
+        data = f"{package}\0{self.get_enrichment_key()}"
+
+        return manifest.hash_bytes(data.encode("utf-8"))[:16]
+
+    def select_templates(
+        self,
+        context: ConstructorContext,
+        path: str | PathLike[str],
+        index_key: str,
+    ) -> dict[str, ConstructorContext]:
+        """
+        **Returns** the **templates** built by a **selective** construction
+        (one with `only` set) of the `context` inside the `path`, mapped to the
+        **context** their **builders** get: the `class` template, with just the
+        **selected** classes, and the `index` template, with all of them,
+        if its `index_key` **differs** from the one of the last **selective**
+        construction or its **document** is **missing**.
+        """
+
+        classes = selection.select_classes(context["classes"], self.only or [])
+
+        contexts: dict[str, ConstructorContext] = {
+            "class": {**context, "classes": classes},  # type: ignore
+        }
+
+        state = selection.read_state(path)
+
+        if (
+            state is None
+            or state.get("index") != index_key
+            or not Path(path).joinpath(f"index.{self.output_format}").exists()
+        ):
+            contexts["index"] = context
+
+        return contexts
+
+    def create_budget(self) -> Budget | None:
+        """
+        **Creates** the `Budget` **enforced** while **rendering** each
+        **document**, if this constructor has a `render_time_budget` or
+        a `render_size_budget`.
+        """
+
+        if self.render_time_budget is None and self.render_size_budget is None:
+            return None
+
+        return Budget(
+            self.render_time_budget,
+            self.render_size_budget,
+            self.budget_fail_fast,
+        )
+
+    def create_observers(self, context: ConstructorContext, enrichment: Enrichment) -> list[Observer]:
+        """
+        **Creates** the `Observers` **notified** during the **construction**
+        of the `context`, according to the **options** of this constructor.
+
+        Returns:
+            list[Observer]: The `Observers` for the **construction**.
+        """
+
+        observers: list[Observer] = []
+
+        is_partial = self.only is not None
+
+        if self.inventory_path is not None:
+            observers.append(Inventory(
+                self.inventory_path,
+                enrichment["labels"] or {},
+                partial=is_partial,
+                format=self.output_format,
+            ))
+
+        if self.changeset_path is not None:
+            observers.append(Changeset(
+                self.changeset_path,
+                is_partial,
+                format=self.output_format,
+            ))
+
+        if self.progress or self.progress_report_path is not None:
+            observers.append(Progress(report_path=self.progress_report_path))
+
+        # Checked last, so that other observers finish even if it fails
+        if self.check_references or self.strict_references:
+            observers.append(References(
+                enrichment["labels"] or {},
+                self.strict_references,
+                partial=is_partial,
+                format=self.output_format,
+            ))
+
+        return observers
+
+    def construct(
+        self,
+        context: ConstructorContext,
+        path: str | PathLike[str],
+        enrichment: Enrichment | None = None,
+    ):
+        """
+        **Builds** the output **documents** for the `context` inside the `path`.
+
+        An `enrichment` previously **derived** from the **same** `context` by
+        `enrich` can be passed to **skip** deriving it again (its `labels`
+        are still **derived** if it lacks them and they're **needed**).
+        Builders get a **copy** of the `context` with it **overlaid** on
+        the **classes** (see `overlay`).
+
+        If `only` is set, just the **selected** classes and the **templates**
+        depending on them are **built** (see `select_templates`).
+        """
 
-    def construct(self, context: ConstructorContext, path: str | PathLike[str]):
         if self.env is None:
             raise AttributeError("construction needs env to be defined")
 
-        self.build_templates(self.env, context, path)
+        if enrichment is None:
+            with self.span("enrich", "construct"):
+                enrichment = self.enrich(context)
+        elif enrichment["labels"] is None and self.needs_labels():
+            with self.span("enrich", "construct"):
+                enrichment = {**enrichment, "labels": self.get_labels(context)}
+
+        context = self.overlay(context, enrichment)
+
+        contexts = None
+
+        if self.only is not None:
+            index_key = selection.get_index_key(context)
+
+            contexts = self.select_templates(context, path, index_key)
+
+        token = observer.observers.set(
+            tuple(self.create_observers(context, enrichment)))
+
+        try:
+            with (
+                trace.use(self.tracer),
+                budget.use(self.create_budget()),
+                self.span("construct", "construct"),
+            ):
+                observer.notify("construct_started", context, path)
+
+                self.build_templates(self.env, context, path, contexts)
+
+                observer.notify("construct_finished", context, path)
+        finally:
+            observer.observers.reset(token)
+
+        # The state is only kept up to date by selective constructions,
+        # so others discard it
+        if self.only is not None:
+            selection.write_state(path, {"index": index_key})
+        else:
+            selection.get_state_path(path).unlink(missing_ok=True)
@@ -0,0 +1,196 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from os import PathLike
+from pathlib import Path
+from typing import Any, Callable, Awaitable
+from jinja2 import Environment, Undefined, nodes
+from jinja2.ext import Extension
+from jinja2.parser import Parser
+from markupsafe import Markup
+
+from . import manifest
+
+DEFAULT_FRAGMENT_CACHE_SIZE = 1024
+"""
+The default **maximum** number of **fragments** kept in **memory** by
+a `FragmentCache`, which is set to `1024`.
+"""
+
+
+class FragmentCache:
+    """
+    A **store** for **rendered fragments** of templates, kept in a
+    **bounded** in-memory cache that **discards** the least recently used
+    fragments and, optionally, in a **directory** that persists them
+    between runs.
+    """
+
+    size: int
+    """
+    The **maximum** number of **fragments** kept in **memory**.
+    """
+
+    path: Path | None
+    """
+    A **path** for a **directory** where **fragments** are also stored, if any.
+    """
+
+    def __init__(self, size: int = DEFAULT_FRAGMENT_CACHE_SIZE, path: str | PathLike[str] | None = None):
+        self.size = size
+        self.path = Path(path) if path is not None else None
+        self.fragments: OrderedDict[str, str] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        """
+        **Returns** the **fragment** stored with the `key`, looking for it in
+        the **directory** if it's not in **memory**, or `None` if not found.
+        """
+
+        with self.lock:
+            fragment = self.fragments.get(key)
+
+            if fragment is not None:
+                self.fragments.move_to_end(key)
+
+                return fragment
+
+        if self.path is None:
+            return None
+
+        try:
+            fragment = self.path.joinpath(f"{key}.txt").read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+        self.remember(key, fragment)
+
+        return fragment
+
+    def set(self, key: str, fragment: str) -> None:
+        """
+        **Stores** the `fragment` with the `key` in **memory** and in
+        the **directory**, if any.
+        """
+
+        self.remember(key, fragment)
+
+        if self.path is None:
+            return
+
+        try:
+            manifest.write_atomic(
+                self.path.joinpath(f"{key}.txt"), fragment.encode("utf-8"))
+        except OSError:
+            pass
+
+    def remember(self, key: str, fragment: str) -> None:
+        """
+        **Stores** the `fragment` with the `key` in **memory**, discarding
+        the least recently used ones beyond the `size`.
+        """
+
+        with self.lock:
+            self.fragments[key] = fragment
+            self.fragments.move_to_end(key)
+
+            while len(self.fragments) > self.size:
+                self.fragments.popitem(last=False)
+
+
+class FragmentCacheExtension(Extension):
+    """
+    A **Jinja extension** that adds the `{% cache key, ... %}...{% endcache %}`
+    **block**, which **renders** its body only once for each **combination**
+    of **key** values, reusing the **rendered fragment** afterwards.
+
+    Keys should include **everything** the body **depends** on, since it's
+    only rendered **again** when they change, and must be **JSON** values
+    (strings, numbers, lists, dicts...).
+    Fragments are stored in the `FragmentCache` of the **environment**,
+    available as `environment.fragment_cache`.
+    """
+
+    tags = {"cache"}
+
+    def __init__(self, environment: Environment):
+        super().__init__(environment)
+
+        environment.extend(fragment_cache=FragmentCache())
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+
+        keys: list[nodes.Expr] = [parser.parse_expression()]
+
+        while parser.stream.skip_if("comma"):
+            keys.append(parser.parse_expression())
+
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+
+        method = "_cache_async" if self.environment.is_async else "_cache"
+
+        # The block is identified by its body too, so that fragments stored
+        # on disk aren't reused after the template changes
+        block = f"{parser.name}:{lineno}:{body!r}"
+
+        args: list[nodes.Expr] = [
+            nodes.Const(hashlib.sha256(block.encode("utf-8")).hexdigest()),
+            nodes.List(keys),
+        ]
+
+        return nodes.CallBlock(
+            self.call_method(method, args), [], [], body
+        ).set_lineno(lineno)
+
+    def get_key(self, block: str, keys: list[Any]) -> str:
+        """
+        **Returns** the **hash** of the `keys` given to the `block` (identified
+        by its template **name**, **line** and **body**).
+
+        Keys must be **JSON** values: **undefined** keys raise an
+        `UndefinedError`, and other values a `TypeError`, since they can't
+        tell **fragments** apart reliably.
+        """
+
+        def fail(value: Any) -> Any:
+            if isinstance(value, Undefined):
+                value._fail_with_undefined_error()
+
+            raise TypeError(
+                f"{{% cache %}} keys must be JSON values, got {type(value).__name__}"
+                " (use | list for sequences)")
+
+        data = json.dumps([block, keys], sort_keys=True, default=fail)
+
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _cache(self, block: str, keys: list[Any], caller: Callable[[], str]) -> Markup:
+        cache: FragmentCache = self.environment.fragment_cache  # type: ignore
+
+        key = self.get_key(block, keys)
+
+        fragment = cache.get(key)
+
+        if fragment is None:
+            fragment = caller()
+
+            cache.set(key, fragment)
+
+        return Markup(fragment)
+
+    async def _cache_async(self, block: str, keys: list[Any], caller: Callable[[], Awaitable[str]]) -> Markup:
+        cache: FragmentCache = self.environment.fragment_cache  # type: ignore
+
+        key = self.get_key(block, keys)
+
+        fragment = cache.get(key)
+
+        if fragment is None:
+            fragment = await caller()
+
+            cache.set(key, fragment)
+
+        return Markup(fragment)
@@ -0,0 +1,103 @@
+from itertools import takewhile
+from typing import Any, TypedDict
+
+from .inventory import MEMBER_KINDS
+
+
+class InheritedMembers(TypedDict):
+    class_name: str
+    members: list[str]
+
+
+class Inheritance(TypedDict):
+    ancestors: list[str]
+    known_parents: list[str]
+    unknown_parents: list[str]
+    inherited: dict[str, list[InheritedMembers]]
+
+
+def get_inheritance(classes: list[dict[str, Any]]) -> dict[str, Inheritance]:
+    """
+    **Returns** the `Inheritance` of every **class** in `classes`, by name:
+    its chain of `ancestors` (closest first), which of them are **documented**
+    (`known_parents`) or not (`unknown_parents`) and, for each **member
+    section**, the **names** of the members it `inherited` from each
+    **documented** ancestor, leaving out the ones **overridden** closer to it.
+
+    Ancestor chains are **resolved** once per class and **reused** by its
+    **descendants**, so **deep** hierarchies aren't walked again for each class.
+    In **cycles**, chains **stop** before reaching the class again.
+    """
+
+    by_name = {class_data["name"]: class_data for class_data in classes}
+
+    chains: dict[str, list[str]] = {}
+
+    def get_ancestors(name: str, visiting: frozenset[str] = frozenset()) -> tuple[list[str], bool]:
+        """
+        **Returns** the chain of **ancestors** of the class with the `name`,
+        **stopping** before any of the classes `visiting` (the descendants it's
+        being resolved for), and whether it was **cut** short by one of them.
+        """
+
+        chain = chains.get(name)
+
+        if chain is not None:
+            return chain, False
+
+        visiting = visiting | {name}
+
+        parents = list(by_name[name].get("parents") or [])
+        cut = False
+
+        # Documented parents have their own chains, which are more
+        # complete than the one given for the class, else it's kept
+        if parents and parents[0] in by_name:
+            if parents[0] in visiting:
+                chain, cut = [], True
+            else:
+                chain, cut = get_ancestors(parents[0], visiting)
+                chain = [parents[0], *chain]
+        else:
+            chain = list(takewhile(lambda p: p not in visiting, parents))
+            cut = len(chain) < len(parents)
+
+        # Chains cut by a cycle depend on where it was entered from
+        if not cut:
+            chains[name] = chain
+
+        return chain, cut
+
+    result: dict[str, Inheritance] = {}
+
+    for name, class_data in by_name.items():
+        ancestors, _ = get_ancestors(name)
+
+        inherited: dict[str, list[InheritedMembers]] = {}
+
+        for section in MEMBER_KINDS:
+            seen = {m["name"] for m in class_data.get(section) or []}
+
+            for ancestor in ancestors:
+                if ancestor not in by_name:
+                    continue
+
+                members = [
+                    m["name"] for m in by_name[ancestor].get(section) or []
+                    if m["name"] not in seen
+                ]
+
+                seen.update(members)
+
+                if members:
+                    inherited.setdefault(section, []).append(
+                        {"class_name": ancestor, "members": members})
+
+        result[name] = {
+            "ancestors": ancestors,
+            "known_parents": [a for a in ancestors if a in by_name],
+            "unknown_parents": [a for a in ancestors if a not in by_name],
+            "inherited": inherited,
+        }
+
+    return result
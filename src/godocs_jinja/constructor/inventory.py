@@ -0,0 +1,262 @@
+import json
+import re
+import zlib
+from os import PathLike
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypedDict
+
+from godocs.constructor.constructor import ConstructorContext
+
+from .observer import Observer
+
+MEMBER_KINDS = {
+    "constants": "constant",
+    "enums": "enum",
+    "signals": "signal",
+    "properties": "property",
+    "methods": "method",
+}
+"""
+Maps the **member sections** of a **class** to the **kind** of
+**entry** their members get in an **inventory**.
+"""
+
+LABEL_PATTERN = re.compile(r"^\.\. _([^:\s][^:]*):[ \t]*$", re.MULTILINE)
+"""
+Matches **label targets** (`.. _label:`) in **RST** documents.
+"""
+
+type Labels = dict[str, tuple[str, str]]
+
+
+class Entry(TypedDict):
+    name: str
+    kind: str
+    label: str
+    document: str
+
+
+def get_labels(
+    classes: list[dict[str, Any]],
+    prefix: str,
+    make_label: Callable[[str, str], str],
+    join_name: Callable[[str, str], str],
+) -> Labels:
+    """
+    **Returns** a `dict` mapping the **label** of every **class** and **member**
+    in `classes` to a `tuple` with its **full name** and **kind**.
+
+    The labels are **made** the same way **templates** make them, through the
+    `make_label` and `join_name` functions (usually the
+    `make_code_member_label_target` and `join_code_member_name` filters),
+    with the `prefix` given.
+    """
+
+    labels: Labels = {}
+
+    for class_data in classes:
+        class_name = class_data["name"]
+
+        labels[make_label(class_name, prefix)] = (class_name, "class")
+
+        for section, kind in MEMBER_KINDS.items():
+            for member in class_data.get(section) or []:
+                name = join_name(member["name"], class_name)
+
+                labels[make_label(name, prefix)] = (name, kind)
+
+                if section != "enums":
+                    continue
+
+                for value in member.get("values") or []:
+                    name = join_name(value["name"], class_name)
+
+                    labels[make_label(name, prefix)] = (name, "constant")
+
+    return labels
+
+
+def make_anchor(label: str) -> str:
+    """
+    **Returns** the **HTML anchor** **Sphinx** (through `docutils`) generates
+    for a `label`: lowercase, with runs of other characters than letters
+    and digits replaced by `-` and starting with a letter.
+    """
+
+    anchor = re.sub(r"[^a-z0-9]+", "-", label.lower()).strip("-")
+
+    return re.sub(r"^[^a-z]+", "", anchor)
+
+
+def read_documents(root: Path, format: str, exclude: set[Path]) -> Iterator[tuple[Path, str]]:
+    """
+    **Yields** the **documents** with the `format` extension inside the
+    `root` directory (leaving out **hidden** ones and the ones in
+    `exclude`), along with their **contents**.
+
+    This is how `Observers` of **partial** constructions account for the
+    **documents** built by **previous** ones.
+    """
+
+    if not root.is_dir():
+        return
+
+    for file in sorted(root.rglob(f"*.{format}")):
+        relative = file.relative_to(root)
+
+        if file in exclude or any(part.startswith(".") for part in relative.parts):
+            continue
+
+        try:
+            yield file, file.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+
+
+class Inventory(Observer):
+    """
+    An `Observer` that **collects** the **label targets** of every **document**
+    written during a **construction** and **writes** them as an **inventory**
+    to a file, mapping each **class** and **member** to its **document**
+    and **label**.
+
+    If the file has the `.inv` extension, a **Sphinx** `objects.inv`
+    (version 2) is written, usable by `intersphinx`.
+    Else, the inventory is written as **JSON**.
+
+    If the construction is `partial`, the labels of the **documents** with
+    the `format` extension left from **previous** constructions are
+    **collected** too, so the inventory still covers **everything**.
+    """
+
+    path: Path
+    """
+    The **path** of the **inventory file** written.
+    """
+
+    labels: Labels
+    """
+    The **known labels**, used to **tell** what **class** or **member**
+    each label found in a document stands for.
+    """
+
+    entries: list[Entry]
+    """
+    The **entries** collected so far.
+    """
+
+    partial: bool
+    """
+    Whether the **construction** only **builds** some of the documents.
+    """
+
+    format: str
+    """
+    The **extension** of the **documents** of the **construction**.
+    """
+
+    written: set[Path]
+    """
+    The **files** written so far.
+    """
+
+    root: Path | None = None
+    """
+    The **output path** of the **construction**, which **document**
+    names are **relative** to.
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        labels: Labels | None = None,
+        partial: bool = False,
+        format: str = "rst",
+    ):
+        self.path = Path(path)
+        self.labels = labels if labels is not None else {}
+        self.partial = partial
+        self.format = format
+        self.entries = []
+        self.written = set()
+
+    def get_document(self, file: Path) -> str:
+        """
+        **Returns** the **document** name of a `file`: its path **relative**
+        to the output path, without **extension**.
+        """
+
+        document = file.with_suffix("")
+
+        if self.root is not None and document.is_relative_to(self.root):
+            document = document.relative_to(self.root)
+
+        return document.as_posix()
+
+    def construct_started(self, context: ConstructorContext, path: str | PathLike[str]) -> None:
+        self.root = Path(path)
+        self.entries = []
+        self.written = set()
+
+    def page_written(self, file: Path, content: str, context: ConstructorContext) -> None:
+        self.written.add(file)
+
+        document = self.get_document(file)
+
+        for label in LABEL_PATTERN.findall(content):
+            name, kind = self.labels.get(label, (label, "label"))
+
+            self.entries.append({
+                "name": name,
+                "kind": kind,
+                "label": label,
+                "document": document,
+            })
+
+    def construct_finished(self, context: ConstructorContext, path: str | PathLike[str]) -> None:
+        if self.partial:
+            for file, content in read_documents(Path(path), self.format, set(self.written)):
+                self.page_written(file, content, context)
+
+        options = context.get("options") or {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.path.suffix == ".inv":
+            self.path.write_bytes(self.to_sphinx(
+                options.get("name") or "Class Reference",
+                options.get("version") or "",
+            ))
+        else:
+            self.path.write_text(json.dumps(self.entries, indent=2))
+
+    def to_sphinx(self, project: str, version: str) -> bytes:
+        """
+        **Returns** the **entries** as a **Sphinx** `objects.inv` (version 2),
+        with one `std:label` entry per **label** and one `std:doc` entry
+        per **document**, linked to **HTML** pages.
+        """
+
+        header = (
+            "# Sphinx inventory version 2\n"
+            f"# Project: {project}\n"
+            f"# Version: {version}\n"
+            "# The remainder of this file is compressed using zlib.\n"
+        )
+
+        lines: list[str] = []
+        documents: dict[str, None] = {}
+
+        for entry in self.entries:
+            documents[entry["document"]] = None
+
+            lines.append(
+                f"{entry['label'].lower()} std:label -1 "
+                f"{entry['document']}.html#{make_anchor(entry['label'])} "
+                f"{entry['name']}\n"
+            )
+
+        for document in documents:
+            lines.append(f"{document} std:doc -1 {document}.html -\n")
+
+        return header.encode("utf-8") + zlib.compress("".join(lines).encode("utf-8"))
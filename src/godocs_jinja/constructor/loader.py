@@ -0,0 +1,71 @@
+import os
+from os import PathLike
+from pathlib import Path
+from typing import Callable
+from jinja2 import BaseLoader, Environment, TemplateNotFound
+from jinja2.loaders import split_template_path
+
+
+class SnapshotLoader(BaseLoader):
+    """
+    A **Jinja loader** that **reads** every **template** inside a directory
+    into **memory** once, when it's **instantiated**.
+
+    Different from the `FileSystemLoader`, templates loaded by it are
+    **never** considered **outdated**, so **rendering** them (and
+    `{% include %}`-ing them) doesn't **touch** the **file system** at all.
+    This is meant for **batch runs**, where templates don't change while
+    the documentation is being built.
+    """
+
+    sources: dict[str, tuple[str, str]]
+    """
+    A `dict` mapping template **names** (paths relative to the
+    **searched directory**, with `/` as separator) to a `tuple` with
+    their **source** and **filename**.
+    """
+
+    def __init__(self, path: str | PathLike[str], encoding: str = "utf-8"):
+        """
+        **Reads** all the files inside the `path` directory (besides the
+        ones in `__pycache__` folders) with the given `encoding`,
+        **skipping** the ones that can't be **decoded** with it.
+        """
+
+        self.sources = {}
+
+        path = Path(path)
+
+        if not path.is_dir():
+            return
+
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+
+            for file in sorted(files):
+                filename = Path(root, file)
+
+                name = filename.relative_to(path).as_posix()
+
+                # Files that aren't text (such as images) can't be templates
+                try:
+                    source = filename.read_text(encoding=encoding)
+                except UnicodeDecodeError:
+                    continue
+
+                self.sources[name] = (source, str(filename))
+
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> tuple[str, str | None, Callable[[], bool] | None]:
+        name = "/".join(split_template_path(template))
+
+        if name not in self.sources:
+            raise TemplateNotFound(template)
+
+        source, filename = self.sources[name]
+
+        return source, filename, lambda: True
+
+    def list_templates(self) -> list[str]:
+        return sorted(self.sources)
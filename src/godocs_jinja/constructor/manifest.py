@@ -0,0 +1,253 @@
+import hashlib
+import importlib.util
+import json
+import marshal
+import os
+import sys
+import tempfile
+from os import PathLike
+from pathlib import Path
+from types import CodeType, ModuleType
+from typing import TypedDict
+
+MANIFEST_VERSION = 1
+"""
+The version of the **manifest** format, **bumped** whenever its
+structure changes so that **old manifests** are **discarded**.
+"""
+
+
+class ScriptEntry(TypedDict):
+    path: str
+    hash: str
+    functions: list[str]
+
+
+class Manifest(TypedDict):
+    version: int
+    templates_path: str
+    templates_mtimes: dict[str, int]
+    templates: list[str]
+    filters: ScriptEntry | None
+    builders: ScriptEntry | None
+
+
+def hash_bytes(data: bytes) -> str:
+    """
+    **Returns** the hexadecimal `sha256` digest of `data`.
+    """
+
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: str | PathLike[str]) -> str:
+    """
+    **Returns** the hexadecimal `sha256` digest of the **contents**
+    of the file in `path`.
+    """
+
+    return hash_bytes(Path(path).read_bytes())
+
+
+def get_mtime(path: Path) -> int:
+    """
+    **Returns** the modification time of `path` in nanoseconds, or `-1`
+    if it doesn't exist.
+    """
+
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def get_manifest_path(cache_path: Path, *paths: Path | None) -> Path:
+    """
+    **Returns** the **path** of the **manifest** inside `cache_path`
+    that corresponds to the combination of `paths`
+    (templates, filters and builders) given.
+    """
+
+    key = "\0".join(
+        str(p.resolve()) if p is not None else "" for p in paths)
+
+    return cache_path / f"manifest-{hash_bytes(key.encode())[:16]}.json"
+
+
+def get_templates_mtimes(templates_path: Path) -> dict[str, int]:
+    """
+    **Returns** the modification times of the `templates_path` and of every
+    **folder** inside it, whether it's a **template** or not.
+
+    Since **adding** or **removing** entries from a **directory** changes its
+    modification time, these are enough to tell whether **discovering**
+    the templates again would give a **different result** (such as when a
+    folder gets an `index.jinja`, becoming a template).
+    """
+
+    mtimes = {str(templates_path): get_mtime(templates_path)}
+
+    if not templates_path.is_dir():
+        return mtimes
+
+    for path in templates_path.iterdir():
+        if path.is_dir() and path.name != "__pycache__":
+            mtimes[str(path)] = get_mtime(path)
+
+    return mtimes
+
+
+def is_templates_fresh(manifest: Manifest, templates_path: Path) -> bool:
+    """
+    **Checks** if the **templates** recorded in the `manifest` are
+    still the ones inside `templates_path`.
+    """
+
+    if manifest["templates_path"] != str(templates_path):
+        return False
+
+    for path, mtime in manifest["templates_mtimes"].items():
+        if get_mtime(Path(path)) != mtime:
+            return False
+
+    return True
+
+
+def get_script_entry(manifest: Manifest | None, key: str, path: Path, hash: str) -> ScriptEntry | None:
+    """
+    **Returns** the `ScriptEntry` stored under `key` in the `manifest`
+    if it matches both the `path` and the `hash` of the script, else `None`.
+    """
+
+    if manifest is None:
+        return None
+
+    entry: ScriptEntry | None = manifest.get(key)  # type: ignore
+
+    if entry is None or entry["path"] != str(path) or entry["hash"] != hash:
+        return None
+
+    return entry
+
+
+def read(path: Path) -> Manifest | None:
+    """
+    **Reads** the **manifest** in `path`, returning `None` if it's
+    missing, unreadable or from another `MANIFEST_VERSION`.
+    """
+
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return None
+
+    return manifest  # type: ignore
+
+
+def get_umask() -> int:
+    """
+    **Returns** the **umask** of the process, which can only be **read**
+    by **setting** it, so it's set back right away.
+    """
+
+    umask = os.umask(0)
+    os.umask(umask)
+
+    return umask
+
+
+FILE_MODE = 0o666 & ~get_umask()
+"""
+The **mode** of the files written by `write_atomic`, the same the **umask**
+gives to files **created** with `open`. It's read once, on **import**, since
+reading the umask while **threads** create files would **change** theirs.
+"""
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    **Writes** `data` to `path` through a temporary file, so that
+    concurrent runs (or threads) never read a partially written file.
+    The file gets the `FILE_MODE`, like any other file **created** by the process.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Unique per call, since threads of the same process can write
+    # the same path at once
+    fd, temp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+
+        # Temporary files are only readable by their owner
+        os.chmod(temp, FILE_MODE)
+
+        os.replace(temp, path)
+    except BaseException:
+        Path(temp).unlink(missing_ok=True)
+
+        raise
+
+
+def write(path: Path, manifest: Manifest) -> None:
+    """
+    **Writes** the `manifest` as **JSON** to `path`.
+    """
+
+    write_atomic(path, json.dumps(manifest, indent=2).encode("utf-8"))
+
+
+def compile_cached(path: Path, source: bytes, hash: str, cache_path: Path) -> CodeType:
+    """
+    **Returns** the **code object** for the script `source` read from `path`.
+
+    The code object is **read** from a **bytecode file** inside `cache_path`
+    named after the `hash` of the script if there's one **compiled by this
+    interpreter**, else it's **compiled** and **saved** there for later runs.
+    """
+
+    key = hash_bytes(f"{path}\0{hash}".encode())
+
+    bytecode_path = cache_path / "bytecode" / f"{key}.pyc"
+
+    magic = importlib.util.MAGIC_NUMBER
+
+    try:
+        data = bytecode_path.read_bytes()
+
+        if data[:len(magic)] == magic:
+            return marshal.loads(data[len(magic):])
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+
+    code = compile(source, str(path), "exec", dont_inherit=True)
+
+    try:
+        write_atomic(bytecode_path, magic + marshal.dumps(code))
+    except OSError:
+        pass
+
+    return code
+
+
+def load_module(name: str, path: Path, source: bytes, hash: str, cache_path: Path) -> ModuleType:
+    """
+    **Loads** and **executes** the script in `path` as a module registered in
+    `sys.modules` under `name`, the same way `godocs.util.module.load` does,
+    but **reusing** its **cached bytecode** when available.
+    """
+
+    mod = ModuleType(name)
+
+    mod.__file__ = str(path)
+
+    exec(compile_cached(path, source, hash, cache_path), mod.__dict__)
+
+    sys.modules[name] = mod
+
+    return mod
@@ -0,0 +1,69 @@
+from contextvars import ContextVar
+from os import PathLike
+from pathlib import Path
+
+from godocs.constructor.constructor import ConstructorContext
+
+
+class Observer:
+    """
+    Base class for objects that are **notified** about the **progress**
+    of a `JinjaConstructor` **construction**.
+
+    Subclasses should **override** the methods of the **events** they're
+    interested in, all of which do nothing by default.
+    """
+
+    def construct_started(self, context: ConstructorContext, path: str | PathLike[str]) -> None:
+        """
+        Called **before** any **builder** runs, with the `context` and
+        the output `path` of the construction.
+        """
+
+    def builder_started(self, name: str) -> None:
+        """
+        Called **before** the **builder** of the template with the
+        `name` runs.
+        """
+
+    def builder_finished(self, name: str) -> None:
+        """
+        Called **after** the **builder** of the template with the
+        `name` ran successfully.
+        """
+
+    def pages_expected(self, count: int) -> None:
+        """
+        Called by **builders** that know **how many** documents they're
+        going to **write**, with that `count`, before writing them.
+        """
+
+    def page_written(self, file: Path, content: str, context: ConstructorContext) -> None:
+        """
+        Called **after** a **document** is **rendered** and **written** to
+        the `file`, with its `content` and the `context` it was rendered with.
+        """
+
+    def construct_finished(self, context: ConstructorContext, path: str | PathLike[str]) -> None:
+        """
+        Called **after** all **builders** ran successfully.
+        """
+
+
+observers: ContextVar[tuple[Observer, ...]] = ContextVar(
+    "observers", default=())
+"""
+The `Observers` of the **construction** currently **running**, set by
+`JinjaConstructor.construct` so that **builders** (which are plain
+functions) can **notify** them without receiving them.
+"""
+
+
+def notify(event: str, *args: object) -> None:
+    """
+    **Calls** the method named `event` of every one of the current
+    `observers` with the given `args`.
+    """
+
+    for observer in observers.get():
+        getattr(observer, event)(*args)
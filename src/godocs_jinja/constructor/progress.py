@@ -0,0 +1,216 @@
+import json
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from os import PathLike
+from pathlib import Path
+from typing import Any, TextIO
+
+from godocs.constructor.constructor import ConstructorContext
+
+from .observer import Observer
+
+DEFAULT_LOG_INTERVAL = 10.0
+"""
+The default number of **seconds** between **progress lines** logged
+when the output **isn't interactive**, which is set to `10`.
+"""
+
+REFRESH_INTERVAL = 0.1
+"""
+The number of **seconds** between **updates** of the **progress line**
+when the output **is interactive**.
+"""
+
+
+def format_bytes(count: float) -> str:
+    """
+    **Returns** a **human readable** representation of a `count` of bytes.
+    """
+
+    for unit in ["B", "KiB", "MiB"]:
+        if count < 1024:
+            return f"{count:.0f}{unit}" if unit == "B" else f"{count:.1f}{unit}"
+
+        count /= 1024
+
+    return f"{count:.1f}GiB"
+
+
+class Progress(Observer):
+    """
+    An `Observer` that **reports** the **progress** of a **construction**:
+    documents written out of the **expected** ones, documents per second,
+    bytes written and the **estimated** time left.
+
+    On an **interactive** terminal, a single **progress line** is kept
+    **updated**. Else (such as in **CI**), a **structured** `key=value` line
+    is **logged** periodically.
+    When the construction **finishes**, a **summary** is printed and, if a
+    `report_path` is given, **appended** to it as a **JSON** line, so that
+    **builds** can be **compared** over time.
+    """
+
+    stream: TextIO
+    """
+    The **stream** progress is **reported** to.
+    """
+
+    interactive: bool
+    """
+    Whether the `stream` is an **interactive** terminal.
+    """
+
+    interval: float
+    """
+    The number of **seconds** between **progress lines** when not `interactive`.
+    """
+
+    report_path: Path | None
+    """
+    A **path** for a **JSON Lines** file the **summary** is appended to, if any.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        interactive: bool | None = None,
+        interval: float = DEFAULT_LOG_INTERVAL,
+        report_path: str | PathLike[str] | None = None,
+    ):
+        self.stream = stream if stream is not None else sys.stderr
+        self.interactive = interactive if interactive is not None else self.stream.isatty()
+        self.interval = interval
+        self.report_path = Path(report_path) if report_path is not None else None
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        **Resets** the **counters** for a new **construction**.
+        """
+
+        self.started = time.perf_counter()
+        self.reported = self.started
+        self.pages = 0
+        self.expected = 0
+        self.bytes = 0
+        self.builders: dict[str, float] = {}
+        self.builder_starts: dict[str, float] = {}
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        **Returns** the current **statistics** of the **construction**.
+        """
+
+        elapsed = time.perf_counter() - self.started
+        rate = self.pages / elapsed if elapsed > 0 else 0.0
+        left = self.expected - self.pages
+
+        return {
+            "pages": self.pages,
+            "expected": self.expected,
+            "bytes": self.bytes,
+            "elapsed": round(elapsed, 3),
+            "pages_per_sec": round(rate, 2),
+            "eta": round(left / rate, 1) if rate > 0 and left > 0 else None,
+        }
+
+    def format_line(self, stats: dict[str, Any]) -> str:
+        """
+        **Returns** the **human readable** progress line for the `stats`.
+        """
+
+        total = f"/{stats['expected']}" if stats["expected"] else ""
+        eta = f", ETA {stats['eta']:.0f}s" if stats["eta"] is not None else ""
+
+        return (
+            f"{stats['pages']}{total} pages, {stats['pages_per_sec']:.1f} pages/s, "
+            f"{format_bytes(stats['bytes'])} written{eta}"
+        )
+
+    def format_record(self, event: str, stats: dict[str, Any]) -> str:
+        """
+        **Returns** the **structured** `key=value` line for the `stats`.
+        """
+
+        fields = " ".join(
+            f"{key}={value}" for key, value in stats.items() if value is not None)
+
+        return f"godocs-jinja {event} {fields}"
+
+    def report(self, force: bool = False):
+        """
+        **Reports** the **progress** to the `stream` if enough time passed
+        since the last report, or if `force`d.
+        """
+
+        now = time.perf_counter()
+
+        interval = REFRESH_INTERVAL if self.interactive else self.interval
+
+        if not force and now - self.reported < interval:
+            return
+
+        self.reported = now
+
+        stats = self.get_stats()
+
+        if self.interactive:
+            self.stream.write(f"\r\033[K{self.format_line(stats)}")
+        else:
+            self.stream.write(f"{self.format_record('progress', stats)}\n")
+
+        self.stream.flush()
+
+    def construct_started(self, context: ConstructorContext, path: str | PathLike[str]) -> None:
+        with self.lock:
+            self.reset()
+
+    def builder_started(self, name: str) -> None:
+        with self.lock:
+            self.builder_starts[name] = time.perf_counter()
+
+    def builder_finished(self, name: str) -> None:
+        with self.lock:
+            started = self.builder_starts.pop(name, self.started)
+
+            self.builders[name] = round(time.perf_counter() - started, 3)
+
+    def pages_expected(self, count: int) -> None:
+        with self.lock:
+            self.expected += count
+
+    def page_written(self, file: Path, content: str, context: ConstructorContext) -> None:
+        with self.lock:
+            self.pages += 1
+            self.bytes += len(content.encode("utf-8"))
+
+            self.report()
+
+    def construct_finished(self, context: ConstructorContext, path: str | PathLike[str]) -> None:
+        with self.lock:
+            stats = self.get_stats()
+
+            if self.interactive:
+                self.stream.write(f"\r\033[K{self.format_line(stats)}\n")
+            else:
+                self.stream.write(f"{self.format_record('summary', stats)}\n")
+
+            self.stream.flush()
+
+            if self.report_path is None:
+                return
+
+            record = {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "output": str(path),
+                **stats,
+                "builders": self.builders,
+            }
+
+            self.report_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(self.report_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
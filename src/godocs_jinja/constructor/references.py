@@ -0,0 +1,186 @@
+import bisect
+import re
+import sys
+import threading
+from os import PathLike
+from pathlib import Path
+from typing import TextIO, TypedDict
+
+from godocs.constructor.constructor import ConstructorContext
+
+from .inventory import LABEL_PATTERN, Labels, read_documents
+from .observer import Observer
+
+REF_PATTERN = re.compile(r":ref:`(?:[^`<]*<([^`<>]+)>|([^`<>]+))`")
+"""
+Matches **references** (`:ref:\\`target\\`` or `:ref:\\`title <target>\\``)
+in **RST** documents, capturing their **target**.
+"""
+
+
+class Reference(TypedDict):
+    target: str
+    document: str
+    class_name: str | None
+    member: str | None
+
+
+class References(Observer):
+    """
+    An `Observer` that **collects** the **references** (`:ref:`) and the
+    **label targets** (`.. _label:`) of every **document** written during a
+    **construction**, and **reports** the references whose **targets** were
+    never written, along with the **class** and **member** they were made in.
+
+    This finds **broken links** right after **rendering**, without
+    a **Sphinx** build. Targets are **compared** ignoring **case**,
+    like **Sphinx** does.
+
+    If the construction is `partial`, the **label targets** of the
+    **documents** with the `format` extension left from **previous**
+    constructions also **resolve** references.
+    """
+
+    stream: TextIO
+    """
+    The **stream** unresolved references are **reported** to.
+    """
+
+    labels: Labels
+    """
+    The **known labels**, used to **tell** what **member** the label
+    **preceding** a reference stands for.
+    """
+
+    fail: bool
+    """
+    Whether the **construction** **fails** when there are unresolved references.
+    """
+
+    references: list[Reference]
+    """
+    The **references** collected so far.
+    """
+
+    targets: set[str]
+    """
+    The **label targets** collected so far, in **lowercase**.
+    """
+
+    partial: bool
+    """
+    Whether the **construction** only **builds** some of the documents.
+    """
+
+    format: str
+    """
+    The **extension** of the **documents** of the **construction**.
+    """
+
+    written: set[Path]
+    """
+    The **files** written so far.
+    """
+
+    root: Path | None = None
+    """
+    The **output path** of the **construction**, which **document**
+    names are **relative** to.
+    """
+
+    def __init__(
+        self,
+        labels: Labels | None = None,
+        fail: bool = False,
+        stream: TextIO | None = None,
+        partial: bool = False,
+        format: str = "rst",
+    ):
+        self.labels = labels if labels is not None else {}
+        self.fail = fail
+        self.stream = stream if stream is not None else sys.stderr
+        self.partial = partial
+        self.format = format
+        self.references = []
+        self.targets = set()
+        self.written = set()
+        self.lock = threading.Lock()
+
+    def get_unresolved(self) -> list[Reference]:
+        """
+        **Returns** the **references** collected whose **targets**
+        weren't **written** in any document.
+        """
+
+        with self.lock:
+            return [
+                r for r in self.references if r["target"].lower() not in self.targets
+            ]
+
+    def construct_started(self, context: ConstructorContext, path: str | PathLike[str]) -> None:
+        with self.lock:
+            self.root = Path(path)
+            self.references = []
+            self.targets = set()
+            self.written = set()
+
+    def page_written(self, file: Path, content: str, context: ConstructorContext) -> None:
+        with self.lock:
+            self.written.add(file)
+
+        if self.root is not None and file.is_relative_to(self.root):
+            file = file.relative_to(self.root)
+
+        class_data = context.get("class")
+        class_name = class_data.get("name") if isinstance(class_data, dict) else None
+
+        matches = list(LABEL_PATTERN.finditer(content))
+        starts = [m.start() for m in matches]
+        references: list[Reference] = []
+
+        for match in REF_PATTERN.finditer(content):
+            # The member a reference is made in is the one whose label
+            # comes last before it
+            index = bisect.bisect_left(starts, match.start())
+            member = None
+
+            if index > 0:
+                label = matches[index - 1].group(1)
+                member = self.labels.get(label, (label, ""))[0]
+
+            references.append({
+                "target": match.group(1) or match.group(2),
+                "document": file.as_posix(),
+                "class_name": class_name,
+                "member": member,
+            })
+
+        with self.lock:
+            self.targets.update(m.group(1).lower() for m in matches)
+            self.references.extend(references)
+
+    def construct_finished(self, context: ConstructorContext, path: str | PathLike[str]) -> None:
+        if self.partial:
+            for _, content in read_documents(Path(path), self.format, set(self.written)):
+                self.targets.update(
+                    m.group(1).lower() for m in LABEL_PATTERN.finditer(content))
+
+        unresolved = self.get_unresolved()
+
+        if not unresolved:
+            return
+
+        for reference in unresolved:
+            origin = reference["member"] or reference["class_name"]
+            origin = f" in {origin}" if origin else ""
+
+            self.stream.write(
+                f"{reference['document']}: unresolved reference to "
+                f"\"{reference['target']}\"{origin}\n"
+            )
+
+        self.stream.flush()
+
+        if self.fail:
+            raise RuntimeError(
+                f"{len(unresolved)} references have no label target")
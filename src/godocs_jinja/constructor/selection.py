@@ -0,0 +1,100 @@
+import hashlib
+import json
+from fnmatch import fnmatchcase
+from os import PathLike
+from pathlib import Path
+from typing import Any, TypedDict
+
+from godocs.constructor.constructor import ConstructorContext
+
+from . import manifest
+
+STATE_NAME = ".godocs-jinja-selection.json"
+"""
+The **name** of the file kept in the **output directory** by **selective
+constructions**, recording what the **index** was last **built** from.
+"""
+
+
+class State(TypedDict):
+    index: str
+
+
+def read_patterns(values: list[str]) -> list[str]:
+    """
+    **Returns** the **class names** or **glob patterns** in `values`,
+    replacing the ones starting with `@` by the **lines** of the
+    **file** they name (such as a list of **changed classes** made from
+    `git diff`), ignoring **blank** lines and `#` **comments**.
+    """
+
+    patterns: list[str] = []
+
+    for value in values:
+        if not value.startswith("@"):
+            patterns.append(value)
+
+            continue
+
+        for line in Path(value[1:]).read_text(encoding="utf-8").splitlines():
+            line = line.split("#", 1)[0].strip()
+
+            if line:
+                patterns.append(line)
+
+    return patterns
+
+
+def select_classes(classes: list[dict[str, Any]], patterns: list[str]) -> list[dict[str, Any]]:
+    """
+    **Returns** the `classes` whose **names** match any of the `patterns`,
+    which can be **names** or **glob patterns**.
+    """
+
+    return [
+        c for c in classes if any(fnmatchcase(c["name"], p) for p in patterns)
+    ]
+
+
+def get_index_key(context: ConstructorContext) -> str:
+    """
+    **Returns** a **hash** of the parts of the `context` the **index**
+    depends on: the **options** and the **names** and **brief descriptions**
+    of the **classes**.
+    """
+
+    data = json.dumps([
+        context.get("options") or {},
+        [[c["name"], c.get("brief_description")] for c in context["classes"]],
+    ], sort_keys=True, default=repr)
+
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def get_state_path(path: str | PathLike[str]) -> Path:
+    """
+    **Returns** the **path** of the **state** file for the output `path`.
+    """
+
+    return Path(path) / STATE_NAME
+
+
+def read_state(path: str | PathLike[str]) -> State | None:
+    """
+    **Returns** the **state** kept in the output `path`, or `None`
+    if there's none or it can't be read.
+    """
+
+    try:
+        return json.loads(get_state_path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def write_state(path: str | PathLike[str], state: State) -> None:
+    """
+    **Writes** the `state` to the output `path`.
+    """
+
+    manifest.write_atomic(
+        get_state_path(path), json.dumps(state).encode("utf-8"))
@@ -0,0 +1,313 @@
+import hashlib
+import re
+from typing import Callable, TypedDict
+
+GROUPINGS = ["alphabet", "namespace", "parents"]
+"""
+The ways **classes** can be **grouped** into a **tree** of **index pages**:
+by the **letters** their names start with, by the **namespaces** in their
+names (`A.B` is in `A`) or by their **parent** classes.
+"""
+
+DEFAULT_INDEX_FAN_OUT = 100
+"""
+The default **maximum** number of **entries** in the `toctree` of a single
+**index page** built by the `build_index_tree_templates` builder, which is
+set to `100`.
+"""
+
+
+class Group(TypedDict):
+    title: str
+    classes: list[str]
+    groups: list["Group"]
+
+
+class IndexPage(TypedDict):
+    name: str
+    title: str
+    root: bool
+    entries: list[str]
+
+
+def get_common_prefix(names: list[str]) -> str:
+    """
+    **Returns** the longest **prefix** all the `names` share, ignoring **case**,
+    as written in the **first** name.
+    """
+
+    first, last = min(names, key=str.upper).upper(), max(names, key=str.upper).upper()
+
+    size = 0
+
+    while size < min(len(first), len(last)) and first[size] == last[size]:
+        size += 1
+
+    return names[0][:size]
+
+
+def group_alphabetically(names: list[str], fan_out: int, prefix: str = "") -> Group:
+    """
+    **Groups** the class `names` starting with `prefix` by the **letter**
+    following the **prefix** they all share, **recursively**, until no group
+    has more than `fan_out` names.
+    """
+
+    group: Group = {"title": prefix, "classes": [], "groups": []}
+
+    if len(names) <= fan_out:
+        group["classes"] = names
+
+        return group
+
+    # Splitting after the prefix shared by all names, instead of one letter
+    # at a time, avoids chains of groups with a single subgroup
+    size = len(get_common_prefix(names))
+
+    buckets: dict[str, list[str]] = {}
+
+    for name in names:
+        if len(name) <= size:
+            group["classes"].append(name)
+        else:
+            buckets.setdefault(name[:size + 1].upper(), []).append(name)
+
+    for bucket in (buckets[key] for key in sorted(buckets)):
+        if len(bucket) == 1:
+            group["classes"].append(bucket[0])
+        else:
+            group["groups"].append(
+                group_alphabetically(bucket, fan_out, bucket[0][:size + 1]))
+
+    return group
+
+
+def group_by_path(names: list[str], get_path: Callable[[str], list[str]]) -> Group:
+    """
+    **Groups** the class `names` into a **tree** following the **path** of
+    group **titles** `get_path` returns for each name. A class with the
+    **same name** as a group **beside** it goes **inside** that group.
+    """
+
+    root: Group = {"title": "", "classes": [], "groups": []}
+
+    for name in names:
+        group = root
+
+        for title in get_path(name):
+            subgroup = next((g for g in group["groups"] if g["title"] == title), None)
+
+            if subgroup is None:
+                subgroup = {"title": title, "classes": [], "groups": []}
+                group["groups"].append(subgroup)
+
+            group = subgroup
+
+        group["classes"].append(name)
+
+    def merge(group: Group):
+        titles = {g["title"]: g for g in group["groups"]}
+
+        for name in list(group["classes"]):
+            if name in titles:
+                group["classes"].remove(name)
+                titles[name]["classes"].insert(0, name)
+
+        for subgroup in group["groups"]:
+            merge(subgroup)
+
+    merge(root)
+
+    return root
+
+
+def collapse(group: Group) -> Group:
+    """
+    **Simplifies** the **subgroups** of the `group`, **recursively**,
+    replacing the ones with a **single** subgroup and no classes by that
+    subgroup, and the ones with a **single** class by that class, so that
+    no **index page** has a single **entry**.
+    """
+
+    groups: list[Group] = []
+
+    for subgroup in group["groups"]:
+        subgroup = collapse(subgroup)
+
+        while not subgroup["classes"] and len(subgroup["groups"]) == 1:
+            subgroup = subgroup["groups"][0]
+
+        if not subgroup["groups"] and len(subgroup["classes"]) == 1:
+            group["classes"].append(subgroup["classes"][0])
+        else:
+            groups.append(subgroup)
+
+    group["groups"] = groups
+
+    return group
+
+
+def group_classes(classes: list[tuple[str, list[str]]], grouping: str, fan_out: int) -> Group:
+    """
+    **Groups** the `classes`, given as **pairs** of their **names** and
+    **parents**, in the way named by `grouping` (one of `GROUPINGS`).
+    """
+
+    names = [name for name, _ in classes]
+
+    if grouping == "alphabet":
+        group = group_alphabetically(sorted(names, key=str.upper), fan_out)
+    elif grouping == "namespace":
+        group = group_by_path(names, lambda name: name.split(".")[:-1])
+    elif grouping == "parents":
+        parents = dict(classes)
+
+        group = group_by_path(names, lambda name: list(reversed(parents[name])))
+    else:
+        raise ValueError(f'unknown index grouping "{grouping}", expected one of {GROUPINGS}')
+
+    group = collapse(group)
+
+    while not group["classes"] and len(group["groups"]) == 1:
+        group = {**group["groups"][0], "title": ""}
+
+    return group
+
+
+MAX_SLUG_LENGTH = 40
+"""
+The **maximum** length of the part of an **index page** name made from
+a group **title**, beyond which it's **shortened** with a **hash**.
+"""
+
+
+def make_slug(title: str) -> str:
+    """
+    **Returns** the part of a **document** name made from a group `title`,
+    **shortened** to `MAX_SLUG_LENGTH` characters.
+    """
+
+    slug = re.sub(r"[^\w-]+", "_", title)
+
+    if len(slug) <= MAX_SLUG_LENGTH:
+        return slug
+
+    hash = hashlib.sha256(title.encode("utf-8")).hexdigest()[:8]
+
+    return f"{slug[:MAX_SLUG_LENGTH - 9]}-{hash}"
+
+
+def get_bounds(group: Group) -> tuple[str, str]:
+    """
+    **Returns** the names of the **first** and **last** classes of the
+    `group`, in the **order** its **index pages** list them.
+    """
+
+    first = group["groups"][0] if group["groups"] else None
+    last = group["classes"][-1] if group["classes"] else None
+
+    return (
+        get_bounds(first)[0] if first is not None else group["classes"][0],
+        last if last is not None else get_bounds(group["groups"][-1])[1],
+    )
+
+
+def get_pages(
+    group: Group,
+    fan_out: int,
+    name: str = "index",
+    root: bool = True,
+    names: set[str] | None = None,
+) -> list[IndexPage]:
+    """
+    **Returns** the **index pages** of the `group` and its **subgroups**,
+    starting with the one named `name`.
+
+    Pages of **subgroups** are named `index-<slug>` after their own
+    **title** alone, with a **number** added if that name is already
+    among the `names` taken. Pages with more than `fan_out` **entries** get
+    their entries **split** among **part** pages (`<name>-part<number>`),
+    **nested** as needed, so that no `toctree` is bigger than `fan_out`.
+    Parts are **titled** after the **first** and **last** classes they
+    lead to, and a **trailing** entry left **alone** isn't put in a part.
+
+    The `fan_out` must be at least `2`, for parts to **shrink** the pages.
+    """
+
+    if fan_out < 2:
+        raise ValueError(f"index fan out must be at least 2, got {fan_out}")
+
+    if names is None:
+        names = {name}
+
+    def take(candidate: str) -> str:
+        unique = candidate
+        number = 2
+
+        while unique in names:
+            unique = f"{candidate}-{number}"
+            number += 1
+
+        names.add(unique)
+
+        return unique
+
+    pages: list[IndexPage] = []
+
+    # Entries are triples of the first and last class they lead to
+    # and a document
+    entries: list[tuple[str, str, str]] = []
+
+    for subgroup in group["groups"]:
+        subpages = get_pages(
+            subgroup,
+            fan_out,
+            take(f"index-{make_slug(subgroup['title'])}"),
+            False,
+            names,
+        )
+
+        first, last = get_bounds(subgroup)
+
+        entries.append((first, last, subpages[0]["name"]))
+        pages.extend(subpages)
+
+    entries.extend((c, c, c) for c in group["classes"])
+
+    count = 0
+
+    while len(entries) > fan_out:
+        parts: list[tuple[str, str, str]] = []
+
+        for start in range(0, len(entries), fan_out):
+            chunk = entries[start:start + fan_out]
+
+            # A part with a single entry would just lead to it
+            if len(chunk) == 1:
+                parts.extend(chunk)
+
+                continue
+
+            count += 1
+
+            part = take(f"{name}-part{count}")
+            first, last = chunk[0][0], chunk[-1][1]
+
+            pages.append({
+                "name": part,
+                "title": f"{first} - {last}",
+                "root": False,
+                "entries": [document for _, _, document in chunk],
+            })
+            parts.append((first, last, part))
+
+        entries = parts
+
+    page: IndexPage = {
+        "name": name,
+        "title": group["title"],
+        "root": root,
+        "entries": [document for _, _, document in entries],
+    }
+
+    return [page, *pages]
@@ -0,0 +1,135 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from os import PathLike
+from pathlib import Path
+from typing import Any, ContextManager, Iterator
+
+
+class Tracer:
+    """
+    **Records** timestamped **spans** of the work done by a `JinjaConstructor`
+    (setup steps, builders, renders and writes), tagged with the **process**
+    and **thread** they ran on, and **exports** them in the **Chrome
+    trace-event** format, viewable in **Perfetto** or `chrome://tracing`.
+    """
+
+    events: list[dict[str, Any]]
+    """
+    The **trace events** recorded so far.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.started = time.perf_counter_ns()
+        self.lock = threading.Lock()
+
+    def get_timestamp(self) -> float:
+        """
+        **Returns** the **microseconds** passed since this `Tracer`
+        was created.
+        """
+
+        return (time.perf_counter_ns() - self.started) / 1000
+
+    @contextmanager
+    def span(self, name: str, category: str, /, **args: Any) -> Iterator[None]:
+        """
+        **Records** a **span** named `name` in the `category`, with the
+        given `args`, lasting while the returned **context manager** is entered.
+        """
+
+        start = self.get_timestamp()
+
+        try:
+            yield
+        finally:
+            end = self.get_timestamp()
+
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start,
+                "dur": end - start,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+
+            with self.lock:
+                self.events.append(event)
+
+    def to_json(self) -> dict[str, Any]:
+        """
+        **Returns** the recorded **events** as a **Chrome trace-event**
+        document, with **metadata** naming the **threads** seen.
+        """
+
+        with self.lock:
+            events = list(self.events)
+
+        names = {
+            thread.ident: thread.name for thread in threading.enumerate()}
+
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": names.get(tid, f"Thread {tid}")},
+            }
+            for pid, tid in sorted({(e["pid"], e["tid"]) for e in events})
+        ]
+
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str | PathLike[str]) -> None:
+        """
+        **Writes** the recorded **events** to the file in `path`.
+        """
+
+        path = Path(path)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        path.write_text(json.dumps(self.to_json()))
+
+
+current: ContextVar[Tracer | None] = ContextVar("tracer", default=None)
+"""
+The `Tracer` recording the work **running**, if any, set by `use`.
+"""
+
+
+@contextmanager
+def use(tracer: Tracer | None) -> Iterator[None]:
+    """
+    **Sets** the `tracer` as the `current` one while the returned
+    **context manager** is entered.
+    """
+
+    token = current.set(tracer)
+
+    try:
+        yield
+    finally:
+        current.reset(token)
+
+
+def span(name: str, category: str, /, **args: Any) -> ContextManager[None]:
+    """
+    **Records** a **span** with the `current` `Tracer`, if there's one,
+    else does nothing.
+    """
+
+    tracer = current.get()
+
+    if tracer is None:
+        return nullcontext()
+
+    return tracer.span(name, category, **args)
@@ -1,5 +1,6 @@
 from godocs.plugin import Plugin as BasePlugin
 from godocs.cli import AppCommand
+from godocs_jinja.cli.batch import JinjaBatchCommand
 from godocs_jinja.cli.command import JinjaCommand
 
 
@@ -8,9 +9,26 @@ class JinjaPlugin(BasePlugin):
     def register(self, app: AppCommand):
         construct = app.subcommands['construct']
 
-        construct.subcommands["jinja"] = JinjaCommand()
+        jinja = JinjaCommand()
 
-        construct.subcommands["jinja"].register(
+        construct.subcommands["jinja"] = jinja
+
+        jinja.register(
             construct.subparsers,
             construct.parent_parser
         )
+
+        # Lets the jinja command load the context from a snapshot
+        # instead of having the construct command always parse it
+        processor = jinja.wrap_processor(construct.process)
+
+        if construct.process in app.processors:
+            index = app.processors.index(construct.process)
+
+            app.processors[index] = processor
+
+        batch = JinjaBatchCommand(jinja, processor)
+
+        construct.subcommands["jinja-batch"] = batch
+
+        batch.register(construct.subparsers)
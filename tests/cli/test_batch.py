@@ -0,0 +1,74 @@
+import json
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+from godocs_jinja.cli import JinjaBatchCommand
+
+from conftest import create_class, create_context, create_jinja_command
+
+
+def test_batch_constructs_projects_with_shared_constructor(tmp_path: Path):
+    # Arrange
+    manifest = tmp_path / "batch.json"
+    manifest.write_text(json.dumps({
+        "workers": 2,
+        "projects": [
+            {"input_dir": "Class1", "output_dir": "build1"},
+            {"input_dir": "Class2", "output_dir": "build2"},
+            {"input_dir": "Class3", "output_dir": "build3", "class_page_size": 10},
+        ],
+    }))
+
+    def processor(args: Namespace) -> Namespace:
+        args.ctx = create_context(create_class(Path(args.input_dir).name))
+        return args
+
+    batch = JinjaBatchCommand(create_jinja_command(), processor)
+
+    # Act
+    batch.execute(Namespace(manifest=str(manifest), workers=None))
+
+    # Assert
+    assert tmp_path.joinpath("build1", "Class1.rst").exists()
+    assert tmp_path.joinpath("build2", "Class2.rst").exists()
+    assert tmp_path.joinpath("build3", "Class3.rst").exists()
+    assert len(batch.constructors) == 2
+
+
+def test_batch_reports_failed_projects(tmp_path: Path):
+    # Arrange
+    manifest = tmp_path / "batch.json"
+    manifest.write_text(json.dumps({
+        "projects": [{"input_dir": "Class1", "output_dir": "build1"}],
+    }))
+
+    def processor(args: Namespace) -> Namespace:
+        raise FileNotFoundError(args.input_dir)
+
+    batch = JinjaBatchCommand(create_jinja_command(), processor)
+
+    # Act / Assert
+    with pytest.raises(RuntimeError):
+        batch.execute(Namespace(manifest=str(manifest), workers=1))
+
+
+@pytest.mark.parametrize("project, message", [
+    ({"input_dir": "Class1"}, 'project 1 is missing "output_dir"'),
+    ({"output_dir": "build1"}, 'project 1 is missing "input_dir"'),
+    ({"input_dir": "Class1", "output_dir": "build1", "class-page-size": 10},
+     "project 1 has unknown options \\['class-page-size'\\]"),
+])
+def test_batch_rejects_invalid_projects(tmp_path: Path, project: dict, message: str):
+    # Arrange
+    manifest = tmp_path / "batch.json"
+    manifest.write_text(json.dumps({"projects": [project]}))
+
+    batch = JinjaBatchCommand(create_jinja_command(), lambda args: args)
+
+    # Act / Assert
+    with pytest.raises(ValueError, match=message):
+        batch.execute(Namespace(manifest=str(manifest), workers=1))
+
+    assert list(tmp_path.iterdir()) == [manifest]
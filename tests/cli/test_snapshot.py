@@ -0,0 +1,141 @@
+from concurrent.futures import ThreadPoolExecutor
+from argparse import Namespace
+from pathlib import Path
+
+from godocs_jinja.cli import JinjaCommand, snapshot
+from godocs_jinja.constructor import manifest
+
+from conftest import create_class, create_context, create_jinja_command
+
+
+def make_args(command: JinjaCommand, tmp_path: Path, *options: str) -> Namespace:
+    return command.parser.parse_args([
+        "--snapshot-dir", str(tmp_path / "snapshots"),
+        *options,
+        str(tmp_path / "xml"),
+        str(tmp_path / "build"),
+    ])
+
+
+def test_get_key_changes_with_sources(tmp_path: Path):
+    # Arrange
+    xml = tmp_path / "xml"
+    xml.mkdir()
+    xml.joinpath("Class1.xml").write_text("<class name='Class1'/>")
+
+    key = snapshot.get_key(xml, None, "rst")
+
+    # Act
+    xml.joinpath("Class1.xml").write_text("<class name='Class2'/>")
+
+    # Assert
+    assert snapshot.get_key(xml, None, "rst") != key
+
+
+def test_snapshot_skips_processor_on_later_runs(tmp_path: Path):
+    # Arrange
+    tmp_path.joinpath("xml").mkdir()
+    tmp_path.joinpath("xml", "Class1.xml").write_text("<class name='Class1'/>")
+
+    context = create_context(create_class("Class1"))
+    calls: list[Namespace] = []
+
+    def processor(args: Namespace) -> Namespace:
+        calls.append(args)
+        args.ctx = context
+        return args
+
+    command = create_jinja_command()
+    process = command.wrap_processor(processor)
+
+    # Act
+    first = process(make_args(command, tmp_path))
+    command.execute(first)
+
+    second = process(make_args(command, tmp_path))
+    command.execute(second)
+
+    # Assert
+    assert len(calls) == 1
+    assert second.ctx == context
+    assert second.snapshot["enrichment"]["labels"] is None
+    assert second.snapshot["enrichment"]["inheritance"]["Class1"]["ancestors"] == []
+    assert tmp_path.joinpath("build", "Class1.rst").exists()
+
+
+def test_snapshot_gets_labels_once_needed(tmp_path: Path):
+    # Arrange
+    tmp_path.joinpath("xml").mkdir()
+    tmp_path.joinpath("xml", "Class1.xml").write_text("<class name='Class1'/>")
+
+    def processor(args: Namespace) -> Namespace:
+        args.ctx = create_context(create_class("Class1"))
+        return args
+
+    command = create_jinja_command()
+    process = command.wrap_processor(processor)
+
+    inventory = ["--inventory", str(tmp_path / "inventory.json")]
+
+    command.execute(process(make_args(command, tmp_path)))
+
+    # Act
+    command.execute(process(make_args(command, tmp_path, *inventory)))
+
+    third = process(make_args(command, tmp_path, *inventory))
+
+    # Assert
+    assert third.snapshot["enrichment"]["labels"]["Class1"] == ("Class1", "class")
+    assert tmp_path.joinpath("inventory.json").exists()
+
+
+def test_snapshot_is_ignored_without_snapshot_dir(tmp_path: Path):
+    # Arrange
+    calls: list[Namespace] = []
+
+    def processor(args: Namespace) -> Namespace:
+        calls.append(args)
+        return args
+
+    process = JinjaCommand().wrap_processor(processor)
+
+    # Act
+    process(Namespace())
+
+    # Assert
+    assert len(calls) == 1
+
+
+def test_write_from_concurrent_threads(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "snapshots" / "key.pickle"
+
+    data: snapshot.Snapshot = {
+        "version": snapshot.SNAPSHOT_VERSION,
+        "context": {"options": {}, "classes": []},
+        "enrichment_key": None,
+        "enrichment": None,
+    }
+
+    # Act
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(snapshot.write, path, data) for _ in range(32)]
+
+    # Assert
+    for future in futures:
+        assert future.exception() is None
+
+    assert snapshot.read(path) == data
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_write_follows_umask(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "snapshots" / "key.pickle"
+    tmp_path.joinpath("open").write_text("")
+
+    # Act
+    manifest.write_atomic(path, b"data")
+
+    # Assert
+    assert path.stat().st_mode & 0o777 == tmp_path.joinpath("open").stat().st_mode & 0o777
@@ -0,0 +1,45 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from godocs_jinja.cli import JinjaCommand
+
+
+def create_class(name: str, **fields: Any) -> dict:
+    return {
+        "name": name,
+        "parents": [],
+        "brief_description": "",
+        "description": "",
+        "properties": [],
+        "methods": [],
+        "signals": [],
+        "constants": [],
+        "enums": [],
+        **fields,
+    }
+
+
+def create_context(*classes: dict, **options: Any) -> dict:
+    return {"options": options, "classes": list(classes)}
+
+
+def create_method(name: str, type: str = "void") -> dict:
+    return {"name": name, "type": type, "args": [], "is_static": False, "description": ""}
+
+
+def create_parent_parser() -> ArgumentParser:
+    parent_parser = ArgumentParser(add_help=False)
+    parent_parser.add_argument("-t", "--translator", default="rst")
+    parent_parser.add_argument("-f", "--format", default="rst")
+    parent_parser.add_argument("-O", "--options-file")
+    parent_parser.add_argument("input_dir")
+    parent_parser.add_argument("output_dir")
+
+    return parent_parser
+
+
+def create_jinja_command() -> JinjaCommand:
+    command = JinjaCommand()
+    command.register(ArgumentParser().add_subparsers(), create_parent_parser())
+
+    return command
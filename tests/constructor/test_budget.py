@@ -0,0 +1,80 @@
+import io
+import json
+import time
+from pathlib import Path
+
+import pytest
+from jinja2 import Environment
+
+from godocs_jinja.constructor import Budget, BudgetExceededError, JinjaConstructor
+
+from conftest import create_class, create_context
+
+
+CONTEXT = create_context(create_class("Class1", description="x" * 1000))
+
+
+def test_budget_aborts_slow_render():
+    # Arrange
+    env = Environment()
+    env.filters["slow"] = lambda value: time.sleep(0.02) or value
+
+    template = env.from_string("{% for i in range(100) %}{{ i | slow }}{% endfor %}")
+
+    stream = io.StringIO()
+
+    budget = Budget(time=0.05, stream=stream)
+
+    # Act
+    result = budget.render(template, "Slow", {"class": {"name": "Slow"}})  # type: ignore
+
+    # Assert
+    assert result is None
+    assert budget.breaches[0]["class_name"] == "Slow"
+    assert "rendering Slow of class Slow exceeded the time budget" in stream.getvalue()
+
+
+def test_construct_skips_documents_over_size_budget(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str],
+):
+    # Arrange
+    constructor = JinjaConstructor().configure(render_size_budget=500)
+
+    # Act
+    constructor.construct(CONTEXT, tmp_path)
+
+    # Assert
+    assert not (tmp_path / "Class1.rst").exists()
+    assert (tmp_path / "index.rst").exists()
+    assert "class/index.jinja: rendering Class1 of class Class1" in capsys.readouterr().err
+
+
+def test_construct_removes_stale_documents_over_budget(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str],
+):
+    # Arrange
+    changeset_path = tmp_path / "changeset.json"
+
+    JinjaConstructor().configure(changeset_path=changeset_path).construct(
+        CONTEXT, tmp_path / "build")
+
+    constructor = JinjaConstructor().configure(
+        render_size_budget=500, changeset_path=changeset_path, only=["Class1"])
+
+    # Act
+    constructor.construct(CONTEXT, tmp_path / "build")
+
+    # Assert
+    assert not (tmp_path / "build" / "Class1.rst").exists()
+    assert "Class1.rst: removed the document of a previous construction" in capsys.readouterr().err
+    assert list(json.loads(changeset_path.read_text())["removed"]) == ["Class1.rst"]
+
+
+def test_construct_fails_fast_over_budget(tmp_path: Path):
+    # Arrange
+    constructor = JinjaConstructor(enable_async=True).configure(
+        render_size_budget=500, budget_fail_fast=True)
+
+    # Act / Assert
+    with pytest.raises(BudgetExceededError, match="Class1"):
+        constructor.construct(CONTEXT, tmp_path)
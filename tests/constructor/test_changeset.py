@@ -0,0 +1,99 @@
+import json
+from pathlib import Path
+
+from godocs_jinja.constructor import JinjaConstructor
+from godocs_jinja.constructor.manifest import hash_bytes
+
+from conftest import create_class, create_context
+
+
+def make_context(*classes: tuple[str, str]) -> dict:
+    return create_context(*(
+        create_class(name, description=description) for name, description in classes))
+
+
+def test_construct_writes_changeset_against_previous(tmp_path: Path):
+    # Arrange
+    output = tmp_path / "build"
+    changeset_path = tmp_path / "changeset.json"
+
+    constructor = JinjaConstructor().configure(changeset_path=changeset_path)
+
+    constructor.construct(make_context(("A", "a"), ("B", "b")), output)
+
+    first = json.loads(changeset_path.read_text())
+
+    # Act
+    constructor.construct(make_context(("A", "changed"), ("C", "c")), output)
+
+    # Assert
+    changes = json.loads(changeset_path.read_text())
+
+    assert sorted(first["added"]) == ["A.rst", "B.rst", "index.rst"]
+    assert list(changes["added"]) == ["C.rst"]
+    assert list(changes["modified"]) == ["A.rst", "index.rst"]
+    assert changes["unchanged"] == {}
+    assert changes["removed"] == {"B.rst": first["added"]["B.rst"]}
+    assert changes["modified"]["A.rst"] == hash_bytes(
+        (output / "A.rst").read_bytes())
+
+
+def test_construct_compares_changeset_with_output_tree(tmp_path: Path):
+    # Arrange
+    JinjaConstructor().construct(make_context(("A", "a")), tmp_path)
+
+    (tmp_path / "old.rst").write_text("old")
+
+    constructor = JinjaConstructor().configure(changeset_path=tmp_path / "changeset.json")
+
+    # Act
+    constructor.construct(make_context(("A", "a")), tmp_path)
+
+    # Assert
+    changes = json.loads((tmp_path / "changeset.json").read_text())
+
+    assert list(changes["unchanged"]) == ["A.rst", "index.rst"]
+    assert list(changes["removed"]) == ["old.rst"]
+    assert changes["added"] == {}
+
+
+def test_construct_first_changeset_ignores_files_of_other_formats(tmp_path: Path):
+    # Arrange
+    (tmp_path / "conf.py").write_text("project = 'Docs'")
+
+    inventory_path = tmp_path / "inventory.json"
+
+    JinjaConstructor().configure(inventory_path=inventory_path).construct(
+        make_context(("A", "a")), tmp_path)
+
+    constructor = JinjaConstructor().configure(
+        changeset_path=tmp_path / "changeset.json", inventory_path=inventory_path)
+
+    # Act
+    constructor.construct(make_context(("A", "a")), tmp_path)
+
+    # Assert
+    changes = json.loads((tmp_path / "changeset.json").read_text())
+
+    assert list(changes["unchanged"]) == ["A.rst", "index.rst"]
+    assert changes["removed"] == {}
+
+
+def test_construct_only_keeps_unbuilt_files_unchanged(tmp_path: Path):
+    # Arrange
+    changeset_path = tmp_path / "changeset.json"
+    context = make_context(("A", "a"), ("B", "b"))
+
+    JinjaConstructor().configure(changeset_path=changeset_path).construct(
+        context, tmp_path / "build")
+
+    constructor = JinjaConstructor().configure(changeset_path=changeset_path, only=["A"])
+
+    # Act
+    constructor.construct(context, tmp_path / "build")
+
+    # Assert
+    changes = json.loads(changeset_path.read_text())
+
+    assert list(changes["unchanged"]) == ["A.rst", "B.rst", "index.rst"]
+    assert changes["removed"] == {}
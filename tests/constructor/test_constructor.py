@@ -1,9 +1,13 @@
+import asyncio
 from pathlib import Path
 import jinja2 as j2
+import pytest
 from textwrap import dedent
 
 from godocs_jinja.constructor import JinjaConstructor
 
+from conftest import create_jinja_command
+
 TEST_FILTERS = """
 def filter1(): return ""
 def filter2(): return ""
@@ -560,3 +564,142 @@ def template2(f, t, c, p): JinjaConstructor.build_template("doc2", f, t, c, p)
 
     assert doc1 == "Template1"
     assert doc2 == "Template2"
+
+
+def test_paginate_class_splits_members():
+    # Arrange
+    class_data = {
+        "name": "Class1",
+        "constants": [{"name": "C1"}],
+        "enums": [{"name": "E1", "values": [{"name": "V1"}, {"name": "V2"}]}],
+        "methods": [{"name": "m1"}, {"name": "m2"}],
+    }
+
+    # Act
+    pages = JinjaConstructor.paginate_class(class_data, 3)
+
+    # Assert
+    assert len(pages) == 3
+    assert pages[0]["constants"] == class_data["constants"]
+    assert pages[0]["enums"] == []
+    assert pages[1]["enums"] == class_data["enums"]
+    assert pages[2]["methods"] == class_data["methods"]
+    assert all(page["name"] == "Class1" for page in pages)
+
+
+def test_paginate_class_keeps_small_classes():
+    # Arrange
+    class_data = {"name": "Class1", "methods": [{"name": "m1"}]}
+
+    # Act
+    pages = JinjaConstructor.paginate_class(class_data, 3)
+
+    # Assert
+    assert pages == [class_data]
+
+
+def test_build_paginated_class_templates_writes_pages(tmp_path: Path):
+    # Arrange
+    env = j2.Environment(loader=j2.DictLoader({"class": dedent("""
+        {%- if page is defined -%}
+        {{ page.number }}/{{ page.count }}:{{ class.methods | map(attribute="name") | join(",") }}
+        {%- else -%}
+        {{ class.name }}
+        {%- endif -%}
+    """)}))
+
+    template = env.get_template("class")
+
+    context = {"classes": [
+        {"name": "Class1", "methods": [{"name": "m1"}, {"name": "m2"}, {"name": "m3"}]},
+        {"name": "Class2", "methods": [{"name": "m1"}]},
+    ]}
+
+    # Act
+    JinjaConstructor.build_paginated_class_templates(
+        "rst", template, context, tmp_path, page_size=2)
+
+    # Assert
+    assert tmp_path.joinpath("Class1.rst").read_text() == "0/2:m1,m2,m3"
+    assert tmp_path.joinpath("Class1-1.rst").read_text() == "1/2:m1,m2"
+    assert tmp_path.joinpath("Class1-2.rst").read_text() == "2/2:m3"
+    assert tmp_path.joinpath("Class2.rst").read_text() == "Class2"
+    assert "page" not in context
+
+
+def test_construction_with_class_page_size_paginates_classes():
+    # Act
+    constructor = JinjaConstructor(class_page_size=10)
+
+    # Assert
+    assert len(constructor.builders) == 2
+    assert "class" in constructor.builders
+    assert constructor.builders["class"] is not JinjaConstructor.build_class_templates
+
+
+def test_build_class_templates_async_writes_to_files(tmp_path: Path):
+    # Arrange
+    env = j2.Environment(loader=j2.DictLoader(
+        {"class": "{{class.name}}"}), enable_async=True)
+
+    template = env.get_template("class")
+
+    # Act
+    asyncio.run(JinjaConstructor.build_class_templates_async(
+        template=template,
+        format="rst",
+        context={"classes": [
+            {"name": "Class1"},
+            {"name": "Class2"},
+        ]},
+        path=tmp_path,
+        concurrency=1,
+    ))
+
+    # Assert
+    assert tmp_path.joinpath("Class1.rst").read_text() == "Class1"
+    assert tmp_path.joinpath("Class2.rst").read_text() == "Class2"
+
+
+def test_build_templates_wraps_sync_builders_when_async(tmp_path: Path):
+    # Arrange
+    templates_path = tmp_path / "templates"
+    templates_path.mkdir()
+    templates_path.joinpath("template1.jinja").write_text("Template1")
+    templates_path.joinpath("template2.jinja").write_text("Template2")
+    builders_path = tmp_path / "builders.py"
+    builders_path.write_text("""
+from godocs_jinja.constructor import JinjaConstructor
+
+def template1(f, t, c, p): JinjaConstructor.build_template("doc1", f, t, c, p)
+async def template2(f, t, c, p): await JinjaConstructor.build_template_async("doc2", f, t, c, p)
+""")
+    build_path = tmp_path / "build"
+
+    constructor = JinjaConstructor(
+        templates_path=templates_path,
+        builders_path=builders_path,
+        enable_async=True,
+    )
+
+    assert constructor.env is not None
+    assert constructor.env.is_async
+
+    # Act
+    constructor.build_templates(constructor.env, context={}, path=build_path)
+
+    # Assert
+    assert build_path.joinpath("doc1.rst").read_text() == "Template1"
+    assert build_path.joinpath("doc2.rst").read_text() == "Template2"
+
+
+def test_async_concurrency_below_one_is_rejected():
+    # Arrange
+    command = create_jinja_command()
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="at least 1"):
+        JinjaConstructor(enable_async=True, async_concurrency=0)
+
+    with pytest.raises(SystemExit):
+        command.parser.parse_args(["--async-concurrency", "0", "xml", "build"])
@@ -0,0 +1,134 @@
+import asyncio
+import pytest
+from pathlib import Path
+import jinja2 as j2
+
+from godocs_jinja.constructor import FragmentCache, FragmentCacheExtension, JinjaConstructor
+
+TEMPLATE = "{% cache item.name %}{{ item.name }}:{{ count() }}{% endcache %}"
+
+
+def make_counter():
+    calls: list[int] = []
+
+    def count() -> int:
+        calls.append(1)
+        return len(calls)
+
+    return count
+
+
+def test_cache_block_reuses_fragments_by_key():
+    # Arrange
+    env = j2.Environment(extensions=[FragmentCacheExtension])
+    template = env.from_string(TEMPLATE)
+    count = make_counter()
+
+    # Act
+    first = template.render(item={"name": "a"}, count=count)
+    second = template.render(item={"name": "a"}, count=count)
+    third = template.render(item={"name": "b"}, count=count)
+
+    # Assert
+    assert first == "a:1"
+    assert second == "a:1"
+    assert third == "b:2"
+
+
+def test_cache_block_works_in_async_environment():
+    # Arrange
+    env = j2.Environment(extensions=[FragmentCacheExtension], enable_async=True)
+    template = env.from_string(TEMPLATE)
+    count = make_counter()
+
+    # Act
+    first = asyncio.run(template.render_async(item={"name": "a"}, count=count))
+    second = asyncio.run(template.render_async(item={"name": "a"}, count=count))
+
+    # Assert
+    assert first == "a:1"
+    assert second == "a:1"
+
+
+def test_fragment_cache_is_bounded():
+    # Arrange
+    cache = FragmentCache(size=2)
+
+    # Act
+    cache.set("a", "A")
+    cache.set("b", "B")
+    cache.get("a")
+    cache.set("c", "C")
+
+    # Assert
+    assert cache.get("a") == "A"
+    assert cache.get("b") is None
+    assert cache.get("c") == "C"
+
+
+def test_fragment_cache_persists_to_directory(tmp_path: Path):
+    # Arrange
+    FragmentCache(path=tmp_path).set("a", "A")
+
+    # Act
+    result = FragmentCache(path=tmp_path).get("a")
+
+    # Assert
+    assert result == "A"
+
+
+def test_constructor_registers_fragment_cache(tmp_path: Path):
+    # Act
+    constructor = JinjaConstructor(fragment_cache_size=10, fragment_cache_path=tmp_path)
+
+    # Assert
+    assert constructor.env is not None
+    assert constructor.env.fragment_cache is constructor.fragment_cache  # type: ignore
+    assert constructor.fragment_cache is not None
+    assert constructor.fragment_cache.size == 10
+    assert "cache" in constructor.env.extensions[
+        "godocs_jinja.constructor.extensions.FragmentCacheExtension"].tags
+
+
+def test_constructor_doesnt_reuse_fragments_after_filters_change(tmp_path: Path):
+    # Arrange
+    filters_path = tmp_path / "filters.py"
+    filters_path.write_text("def shout(value): return value.upper()")
+
+    cache_path = tmp_path / "fragments"
+
+    JinjaConstructor(
+        filters_path=filters_path, fragment_cache_path=cache_path,
+    ).fragment_cache.set("a", "A")  # type: ignore
+
+    filters_path.write_text("def shout(value): return value.upper() + '!'")
+
+    # Act
+    constructor = JinjaConstructor(
+        filters_path=filters_path, fragment_cache_path=cache_path)
+
+    # Assert
+    assert constructor.fragment_cache is not None
+    assert constructor.fragment_cache.get("a") is None
+    assert len(list(cache_path.iterdir())) == 1
+
+
+def test_cache_block_rejects_undefined_keys():
+    # Arrange
+    env = j2.Environment(extensions=[FragmentCacheExtension])
+    template = env.from_string("{% cache item.nme %}{{ item.name }}{% endcache %}")
+
+    # Act / Assert
+    with pytest.raises(j2.UndefinedError):
+        template.render(item={"name": "a"})
+
+
+def test_cache_block_rejects_keys_that_arent_json():
+    # Arrange
+    env = j2.Environment(extensions=[FragmentCacheExtension])
+    template = env.from_string(
+        '{% cache items | map(attribute="name") %}x{% endcache %}')
+
+    # Act / Assert
+    with pytest.raises(TypeError, match="JSON values"):
+        template.render(items=[{"name": "a"}])
@@ -0,0 +1,71 @@
+from pathlib import Path
+
+from godocs_jinja.constructor import JinjaConstructor
+from godocs_jinja.constructor.inheritance import get_inheritance
+
+from conftest import create_class, create_context, create_method
+
+
+def make_class(name: str, parents: list[str], methods: list[str]) -> dict:
+    return create_class(name, parents=parents, methods=[create_method(m) for m in methods])
+
+
+CLASSES = [
+    make_class("Base", ["RefCounted", "Object"], ["a", "b"]),
+    make_class("Middle", ["Base"], ["b", "c"]),
+    make_class("Leaf", ["Middle"], ["c"]),
+]
+
+
+def test_get_inheritance_resolves_ancestors_and_members():
+    # Act
+    inheritance = get_inheritance(CLASSES)
+
+    # Assert
+    leaf = inheritance["Leaf"]
+
+    assert leaf["ancestors"] == ["Middle", "Base", "RefCounted", "Object"]
+    assert leaf["known_parents"] == ["Middle", "Base"]
+    assert leaf["unknown_parents"] == ["RefCounted", "Object"]
+    assert leaf["inherited"] == {"methods": [
+        {"class_name": "Middle", "members": ["b"]},
+        {"class_name": "Base", "members": ["a"]},
+    ]}
+
+
+def test_get_inheritance_stops_at_cycles():
+    # Arrange
+    classes = [
+        make_class("A", ["B"], []),
+        make_class("B", ["C"], []),
+        make_class("C", ["A"], []),
+        make_class("D", ["D", "Object"], []),
+    ]
+
+    # Act
+    inheritance = get_inheritance(classes)
+
+    # Assert
+    assert inheritance["A"]["ancestors"] == ["B", "C"]
+    assert inheritance["B"]["ancestors"] == ["C", "A"]
+    assert inheritance["C"]["ancestors"] == ["A", "B"]
+    assert inheritance["D"]["ancestors"] == []
+
+
+def test_construct_overlays_inheritance_on_classes(tmp_path: Path):
+    # Arrange
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "class.jinja").write_text(
+        "{{ class.inheritance.known_parents | join(',') }}")
+
+    context = create_context(*CLASSES)
+
+    constructor = JinjaConstructor(templates_path=templates)
+
+    # Act
+    constructor.construct(context, tmp_path / "build")
+
+    # Assert
+    assert (tmp_path / "build" / "Leaf.rst").read_text() == "Middle,Base"
+    assert "inheritance" not in CLASSES[2]
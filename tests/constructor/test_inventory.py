@@ -0,0 +1,78 @@
+import json
+import zlib
+from pathlib import Path
+
+from godocs_jinja.constructor import JinjaConstructor
+from godocs_jinja.constructor.inventory import make_anchor
+
+from conftest import create_class, create_context, create_method
+
+
+CONTEXT = create_context(
+    create_class(
+        "Class1",
+        methods=[create_method("m1", "int")],
+        constants=[{"name": "C1", "value": "1", "description": ""}],
+    ),
+    ref_prefix="doc",
+    name="Docs",
+)
+
+
+def test_get_labels_maps_classes_and_members():
+    # Arrange
+    constructor = JinjaConstructor()
+
+    # Act
+    labels = constructor.get_labels(CONTEXT)
+
+    # Assert
+    assert labels == {
+        "doc_Class1": ("Class1", "class"),
+        "doc_Class1_C1": ("Class1.C1", "constant"),
+        "doc_Class1_m1": ("Class1.m1", "method"),
+    }
+
+
+def test_construct_writes_json_inventory(tmp_path: Path):
+    # Arrange
+    inventory_path = tmp_path / "inventory.json"
+
+    constructor = JinjaConstructor().configure(inventory_path=inventory_path)
+
+    # Act
+    constructor.construct(CONTEXT, tmp_path / "build")
+
+    # Assert
+    entries = json.loads(inventory_path.read_text())
+
+    assert {"name": "Class1.m1", "kind": "method", "label": "doc_Class1_m1",
+            "document": "Class1"} in entries
+    assert {"name": "Class1", "kind": "class", "label": "doc_Class1",
+            "document": "Class1"} in entries
+    assert len(entries) == 3
+
+
+def test_construct_writes_sphinx_inventory(tmp_path: Path):
+    # Arrange
+    inventory_path = tmp_path / "objects.inv"
+
+    constructor = JinjaConstructor().configure(inventory_path=inventory_path)
+
+    # Act
+    constructor.construct(CONTEXT, tmp_path / "build")
+
+    # Assert
+    header, _, body = inventory_path.read_bytes().partition(
+        b"# The remainder of this file is compressed using zlib.\n")
+    lines = zlib.decompress(body).decode().splitlines()
+
+    assert header.startswith(b"# Sphinx inventory version 2\n# Project: Docs\n")
+    assert "doc_class1_m1 std:label -1 Class1.html#doc-class1-m1 Class1.m1" in lines
+    assert "Class1 std:doc -1 Class1.html -" in lines
+
+
+def test_make_anchor_follows_docutils_ids():
+    # Act / Assert
+    assert make_anchor("doc_Class1_m1") == "doc-class1-m1"
+    assert make_anchor("_1Class") == "class"
@@ -0,0 +1,68 @@
+from pathlib import Path
+import jinja2 as j2
+import pytest
+
+from godocs_jinja.constructor import JinjaConstructor, SnapshotLoader
+
+
+def test_snapshot_loader_reads_templates_once(tmp_path: Path):
+    # Arrange
+    template_dir = tmp_path / "template1"
+    template_dir.mkdir()
+    template_dir.joinpath("index.jinja").write_text(
+        '{% include "template1/part.jinja" %}!')
+    template_dir.joinpath("part.jinja").write_text("Part")
+
+    loader = SnapshotLoader(tmp_path)
+
+    template_dir.joinpath("part.jinja").write_text("Changed")
+
+    env = j2.Environment(loader=loader, auto_reload=False)
+
+    # Act
+    result = env.get_template("template1/index.jinja").render()
+
+    # Assert
+    assert result == "Part!"
+    assert loader.list_templates() == [
+        "template1/index.jinja", "template1/part.jinja"]
+
+
+def test_snapshot_loader_skips_binary_files(tmp_path: Path):
+    # Arrange
+    tmp_path.joinpath("template1.jinja").write_text("Template1")
+    tmp_path.joinpath("logo.png").write_bytes(b"\x89PNG\r\n\x1a\n\xff\xfe")
+    tmp_path.joinpath(".DS_Store").write_bytes(b"\x00\x00\x00\x01Bud1\xff")
+
+    # Act
+    loader = SnapshotLoader(tmp_path)
+
+    # Assert
+    assert loader.list_templates() == ["template1.jinja"]
+
+
+def test_snapshot_loader_raises_not_found(tmp_path: Path):
+    # Arrange
+    env = j2.Environment(loader=SnapshotLoader(tmp_path))
+
+    # Act / Assert
+    with pytest.raises(j2.TemplateNotFound):
+        env.get_template("missing.jinja")
+
+
+def test_frozen_construction_uses_snapshot_loader(tmp_path: Path):
+    # Arrange
+    templates_path = tmp_path / "templates"
+    templates_path.mkdir()
+    templates_path.joinpath("template1.jinja").write_text("Template1")
+
+    # Act
+    constructor = JinjaConstructor(
+        templates_path=templates_path, frozen_templates=True)
+
+    # Assert
+    assert constructor.env is not None
+    assert isinstance(constructor.env.loader, SnapshotLoader)
+    assert not constructor.env.auto_reload
+    assert constructor.env.get_template(
+        "template1.jinja").render() == "Template1"
@@ -0,0 +1,179 @@
+from pathlib import Path
+
+import pytest
+
+from godocs_jinja.constructor import JinjaConstructor, manifest
+
+TEST_FILTERS = """
+def filter1(): return ""
+def filter2(): return ""
+"""
+
+TEST_BUILDERS = """
+def template1(f, t, c, p): pass
+"""
+
+
+def make_model(path: Path) -> Path:
+    model = path / "model"
+    templates = model / "templates"
+    template_dir = templates / "template1"
+
+    template_dir.mkdir(parents=True)
+    template_dir.joinpath("index.jinja").write_text("Template1")
+    templates.joinpath("template2.jinja").write_text("Template2")
+    model.joinpath("filters.py").write_text(TEST_FILTERS)
+
+    return model
+
+
+def test_cached_construction_writes_manifest_and_bytecode(tmp_path: Path):
+    # Arrange
+    model = make_model(tmp_path)
+    cache = tmp_path / "cache"
+
+    # Act
+    constructor = JinjaConstructor(model=model, cache_path=cache)
+
+    # Assert
+    manifests = list(cache.glob("manifest-*.json"))
+
+    assert len(manifests) == 1
+    assert len(list(cache.joinpath("bytecode").glob("*.pyc"))) == 1
+
+    cached = manifest.read(manifests[0])
+
+    assert cached is not None
+    assert sorted(Path(t).stem for t in cached["templates"]) == [
+        "template1", "template2"]
+    assert cached["filters"] is not None
+    assert cached["filters"]["functions"] == ["filter1", "filter2"]
+    assert cached["builders"] is None
+    assert [f[0] for f in constructor.filters] == ["filter1", "filter2"]
+    assert "class" in constructor.builders
+    assert "index" in constructor.builders
+
+
+def test_cached_construction_reuses_manifest(tmp_path: Path):
+    # Arrange
+    model = make_model(tmp_path)
+    cache = tmp_path / "cache"
+
+    JinjaConstructor(model=model, cache_path=cache)
+
+    manifest_path = next(cache.glob("manifest-*.json"))
+    mtime = manifest_path.stat().st_mtime_ns
+
+    # Act
+    constructor = JinjaConstructor(model=model, cache_path=cache)
+
+    # Assert
+    assert manifest_path.stat().st_mtime_ns == mtime
+    assert sorted(t.stem for t in constructor.templates) == [
+        "template1", "template2"]
+    assert [f[0] for f in constructor.filters] == ["filter1", "filter2"]
+
+
+def test_cached_construction_doesnt_list_fresh_templates(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+):
+    # Arrange
+    model = make_model(tmp_path)
+    cache = tmp_path / "cache"
+
+    JinjaConstructor(model=model, cache_path=cache)
+
+    def fail(*args):
+        raise AssertionError("templates listed again")
+
+    monkeypatch.setattr(manifest, "get_templates_mtimes", fail)
+    monkeypatch.setattr(JinjaConstructor, "find_templates", fail)
+
+    # Act
+    constructor = JinjaConstructor(model=model, cache_path=cache)
+
+    # Assert
+    assert sorted(t.stem for t in constructor.templates) == [
+        "template1", "template2"]
+
+
+def test_cached_construction_detects_changed_scripts(tmp_path: Path):
+    # Arrange
+    model = make_model(tmp_path)
+    cache = tmp_path / "cache"
+    builders_path = tmp_path / "builders.py"
+
+    builders_path.write_text(TEST_BUILDERS)
+
+    JinjaConstructor(model=model, builders_path=builders_path, cache_path=cache)
+
+    model.joinpath("filters.py").write_text('def filter3(): return ""')
+
+    # Act
+    constructor = JinjaConstructor(
+        model=model, builders_path=builders_path, cache_path=cache)
+
+    # Assert
+    assert [f[0] for f in constructor.filters] == ["filter3"]
+    assert list(constructor.builders) == ["template1"]
+    assert len(list(cache.joinpath("bytecode").glob("*.pyc"))) == 3
+
+
+def test_cached_construction_detects_new_templates(tmp_path: Path):
+    # Arrange
+    model = make_model(tmp_path)
+    cache = tmp_path / "cache"
+
+    JinjaConstructor(model=model, cache_path=cache)
+
+    model.joinpath("templates", "template3.jinja").write_text("Template3")
+
+    # Act
+    constructor = JinjaConstructor(model=model, cache_path=cache)
+
+    # Assert
+    assert sorted(t.stem for t in constructor.templates) == [
+        "template1", "template2", "template3"]
+
+
+def test_cached_construction_detects_folders_becoming_templates(tmp_path: Path):
+    # Arrange
+    model = make_model(tmp_path)
+    cache = tmp_path / "cache"
+
+    model.joinpath("templates", "template3").mkdir()
+
+    JinjaConstructor(model=model, cache_path=cache)
+
+    model.joinpath("templates", "template3", "index.jinja").write_text("Template3")
+
+    # Act
+    constructor = JinjaConstructor(model=model, cache_path=cache)
+
+    # Assert
+    assert sorted(t.stem for t in constructor.templates) == [
+        "template1", "template2", "template3"]
+
+
+def test_cached_construction_skips_walking_models(tmp_path: Path):
+    # Act
+    constructor = JinjaConstructor(cache_path=tmp_path / "cache")
+
+    # Assert
+    assert constructor.models == []
+    assert constructor.model is not None
+    assert constructor.model.stem == "rst"
+    assert sorted(t.stem for t in constructor.templates) == ["class", "index"]
+
+
+def test_read_ignores_other_versions(tmp_path: Path):
+    # Arrange
+    path = tmp_path / "manifest.json"
+
+    path.write_text('{"version": -1}')
+
+    # Act
+    result = manifest.read(path)
+
+    # Assert
+    assert result is None
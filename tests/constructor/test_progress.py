@@ -0,0 +1,58 @@
+import io
+import json
+from pathlib import Path
+
+from godocs_jinja.constructor import JinjaConstructor, Progress
+
+from conftest import create_class, create_context
+
+
+CONTEXT = create_context(*(create_class(f"Class{i}") for i in range(3)))
+
+
+def test_progress_logs_structured_lines_and_summary(tmp_path: Path):
+    # Arrange
+    stream = io.StringIO()
+    report = tmp_path / "report.jsonl"
+    progress = Progress(stream, interactive=False, interval=0, report_path=report)
+
+    constructor = JinjaConstructor()
+    constructor.create_observers = lambda context, enrichment: [progress]  # type: ignore
+
+    # Act
+    constructor.construct(CONTEXT, tmp_path / "build")
+    constructor.construct(CONTEXT, tmp_path / "build")
+
+    # Assert
+    lines = stream.getvalue().splitlines()
+
+    assert lines[0].startswith("godocs-jinja progress pages=1 expected=")
+    assert lines[-1].startswith("godocs-jinja summary pages=4 expected=4 ")
+
+    records = [json.loads(line) for line in report.read_text().splitlines()]
+
+    assert len(records) == 2
+    assert records[0]["pages"] == 4
+    assert records[0]["bytes"] > 0
+    assert set(records[0]["builders"]) == {"class", "index"}
+
+
+def test_progress_updates_single_line_when_interactive(tmp_path: Path):
+    # Arrange
+    stream = io.StringIO()
+    progress = Progress(stream, interactive=True)
+
+    # Act
+    progress.construct_started({}, tmp_path)
+    progress.pages_expected(2)
+    progress.page_written(tmp_path / "a.rst", "abc", {})
+    progress.page_written(tmp_path / "b.rst", "abc", {})
+    progress.construct_finished({}, tmp_path)
+
+    # Assert
+    output = stream.getvalue()
+
+    assert output.endswith("\n")
+    assert output.count("\n") == 1
+    assert "2/2 pages" in output
+    assert "6B written" in output
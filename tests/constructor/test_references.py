@@ -0,0 +1,67 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from godocs_jinja.constructor import JinjaConstructor, References
+
+from conftest import create_class, create_context
+
+
+CONTEXT = create_context(
+    create_class("Class1", parents=["Class2"]),
+    create_class("Class2", parents=["Missing"]),
+    ref_prefix="doc",
+)
+
+
+def test_references_reports_unresolved_with_member(tmp_path: Path):
+    # Arrange
+    stream = io.StringIO()
+
+    references = References({"doc_A_m": ("A.m", "method")}, stream=stream)
+
+    content = (
+        ".. _doc_A:\n\n:ref:`doc_A`\n\n"
+        ".. _doc_A_m:\n\n:ref:`m <doc_B>` and :ref:`DOC_A_M`\n"
+    )
+
+    # Act
+    references.construct_started({}, tmp_path)
+    references.page_written(
+        tmp_path / "A.rst", content, {"class": {"name": "A"}})  # type: ignore
+    references.construct_finished({}, tmp_path)
+
+    # Assert
+    assert references.get_unresolved() == [{
+        "target": "doc_B",
+        "document": "A.rst",
+        "class_name": "A",
+        "member": "A.m",
+    }]
+    assert stream.getvalue() == 'A.rst: unresolved reference to "doc_B" in A.m\n'
+
+
+def test_construct_reports_broken_parent_reference(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str],
+):
+    # Arrange
+    constructor = JinjaConstructor().configure(check_references=True)
+
+    # Act
+    constructor.construct(CONTEXT, tmp_path)
+
+    # Assert
+    errors = capsys.readouterr().err
+
+    assert '"doc_Missing" in Class2' in errors
+    assert "doc_Class2" not in errors
+
+
+def test_construct_fails_with_strict_references(tmp_path: Path):
+    # Arrange
+    constructor = JinjaConstructor().configure(strict_references=True)
+
+    # Act / Assert
+    with pytest.raises(RuntimeError, match="1 references"):
+        constructor.construct(CONTEXT, tmp_path)
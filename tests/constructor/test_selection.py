@@ -0,0 +1,105 @@
+import json
+from pathlib import Path
+
+from godocs_jinja.constructor import JinjaConstructor
+from godocs_jinja.constructor.selection import read_patterns, select_classes
+
+from conftest import create_class, create_context
+
+
+def test_read_patterns_reads_files(tmp_path: Path):
+    # Arrange
+    changed = tmp_path / "changed.txt"
+    changed.write_text("Player\n\n# ignored\nEnemy*  # comment\n")
+
+    # Act
+    patterns = read_patterns(["Node", f"@{changed}"])
+
+    # Assert
+    assert patterns == ["Node", "Player", "Enemy*"]
+
+
+def test_select_classes_matches_names_and_globs():
+    # Arrange
+    classes = [create_class("Player"), create_class("EnemyA"), create_class("Item")]
+
+    # Act
+    selected = select_classes(classes, ["Player", "Enemy*"])
+
+    # Assert
+    assert [c["name"] for c in selected] == ["Player", "EnemyA"]
+
+
+def test_construct_only_builds_selected_classes(tmp_path: Path):
+    # Arrange
+    context = create_context(create_class("Class1"), create_class("Class2"))
+
+    JinjaConstructor().construct(context, tmp_path)
+
+    (tmp_path / "Class1.rst").unlink()
+    (tmp_path / "Class2.rst").unlink()
+
+    constructor = JinjaConstructor().configure(only=["Class1"])
+
+    # Act
+    constructor.construct(context, tmp_path)
+
+    (tmp_path / "index.rst").write_text("stale")
+
+    constructor.construct(context, tmp_path)
+
+    # Assert
+    assert (tmp_path / "Class1.rst").exists()
+    assert not (tmp_path / "Class2.rst").exists()
+    assert (tmp_path / "index.rst").read_text() == "stale"
+
+
+def test_construct_only_rebuilds_index_when_briefs_change(tmp_path: Path):
+    # Arrange
+    constructor = JinjaConstructor().configure(only=["Class1"])
+
+    constructor.construct(
+        create_context(create_class("Class1")), tmp_path)
+
+    (tmp_path / "index.rst").write_text("stale")
+
+    # Act
+    constructor.construct(
+        create_context(create_class("Class1", brief_description="changed")), tmp_path)
+
+    # Assert
+    assert "Class1" in (tmp_path / "index.rst").read_text()
+
+
+def test_construct_only_keeps_inventory_of_previous_documents(tmp_path: Path):
+    # Arrange
+    context = create_context(create_class("Class1"), create_class("Class2"))
+    inventory_path = tmp_path / "inventory.json"
+
+    JinjaConstructor().configure(inventory_path=inventory_path).construct(
+        context, tmp_path / "build")
+
+    full = json.loads(inventory_path.read_text())
+
+    constructor = JinjaConstructor().configure(inventory_path=inventory_path, only=["Class1"])
+
+    # Act
+    constructor.construct(context, tmp_path / "build")
+
+    # Assert
+    partial = json.loads(inventory_path.read_text())
+
+    assert sorted(partial, key=str) == sorted(full, key=str)
+
+
+def test_construct_only_resolves_references_to_previous_documents(tmp_path: Path):
+    # Arrange
+    context = create_context(
+        create_class("Class1"), create_class("Class2", parents=["Class1"]))
+
+    JinjaConstructor().configure(strict_references=True).construct(context, tmp_path)
+
+    constructor = JinjaConstructor().configure(strict_references=True, only=["Class2"])
+
+    # Act / Assert
+    constructor.construct(context, tmp_path)
@@ -0,0 +1,165 @@
+from pathlib import Path
+
+import pytest
+
+from godocs_jinja.constructor import JinjaConstructor
+from godocs_jinja.constructor.toc import get_pages, group_classes
+
+from conftest import create_class, create_context, create_jinja_command
+
+
+def test_group_classes_alphabetically_bounds_groups():
+    # Arrange
+    classes = [(name, []) for name in ["Apple", "Avocado", "Banana", "Cherry"]]
+
+    # Act
+    group = group_classes(classes, "alphabet", 2)
+
+    # Assert
+    assert group["classes"] == ["Banana", "Cherry"]
+    assert group["groups"] == [
+        {"title": "A", "classes": ["Apple", "Avocado"], "groups": []}]
+
+
+def test_group_classes_by_parents_nests_children_with_parent():
+    # Arrange
+    classes = [
+        ("Object", []),
+        ("Node", ["Object"]),
+        ("Node2D", ["Node", "Object"]),
+        ("Node3D", ["Node", "Object"]),
+        ("Resource", ["RefCounted", "Object"]),
+        ("Texture", ["Resource", "RefCounted", "Object"]),
+    ]
+
+    # Act
+    group = group_classes(classes, "parents", 10)
+
+    # Assert
+    assert group["title"] == ""
+    assert group["classes"] == ["Object"]
+    assert [g["title"] for g in group["groups"]] == ["Node", "Resource"]
+    assert group["groups"][0]["classes"] == ["Node", "Node2D", "Node3D"]
+    assert group["groups"][1]["classes"] == ["Resource", "Texture"]
+
+
+def test_group_classes_alphabetically_splits_after_shared_prefix():
+    # Arrange
+    classes = [(f"MyCompanyInventorySystemItem{i:03}", []) for i in range(150)]
+
+    # Act
+    group = group_classes(classes, "alphabet", 100)
+    pages = get_pages(group, 100)
+
+    # Assert
+    assert [g["title"] for g in group["groups"]] == [
+        "MyCompanyInventorySystemItem0", "MyCompanyInventorySystemItem1"]
+    assert [p["name"] for p in pages] == [
+        "index",
+        "index-MyCompanyInventorySystemItem0",
+        "index-MyCompanyInventorySystemItem1",
+    ]
+
+
+def test_group_classes_never_chains_single_entry_pages():
+    # Arrange
+    classes = [(f"SteamLobby{i:03}", []) for i in range(30)]
+    classes += [("Apple", []), ("Banana", [])]
+
+    # Act
+    pages = get_pages(group_classes(classes, "alphabet", 10), 10)
+
+    # Assert
+    assert all(len(page["entries"]) > 1 for page in pages)
+    assert all(len(page["entries"]) <= 10 for page in pages)
+    assert len(pages) == 5
+
+
+def test_get_pages_names_pages_after_their_own_title():
+    # Arrange
+    inner = {"title": "B" * 100, "classes": ["X", "Y"], "groups": []}
+    group = {"title": "", "classes": [], "groups": [
+        {"title": "A", "classes": ["Z"], "groups": [inner]},
+        {"title": "A!", "classes": ["U", "V"], "groups": []},
+    ]}
+
+    # Act
+    pages = get_pages(group, 10)  # type: ignore
+
+    # Assert
+    names = [page["name"] for page in pages]
+
+    assert names[:2] == ["index", "index-A"]
+    assert names[2].startswith("index-BBBB") and len(names[2]) == 46
+    assert names[3] == "index-A_"
+
+
+def test_get_pages_splits_pages_over_fan_out():
+    # Arrange
+    group = {"title": "", "classes": ["A", "B", "C", "D", "E"], "groups": []}
+
+    # Act
+    pages = get_pages(group, 2)  # type: ignore
+
+    # Assert
+    assert pages[0]["name"] == "index"
+    assert all(2 >= len(page["entries"]) > 1 for page in pages)
+    assert sorted(
+        e for page in pages for e in page["entries"] if len(e) == 1
+    ) == ["A", "B", "C", "D", "E"]
+
+
+def test_get_pages_titles_parts_after_their_classes():
+    # Arrange
+    group = group_classes(
+        [(name, []) for name in ["Base", "Boss", "Enemy", "Foo", "Player"]],
+        "alphabet",
+        2,
+    )
+
+    # Act
+    pages = get_pages(group, 2)
+
+    # Assert
+    assert [(p["title"], p["entries"]) for p in pages if "part" in p["name"]] == [
+        ("Base - Enemy", ["index-B", "Enemy"]),
+        ("Foo - Player", ["Foo", "Player"]),
+    ]
+
+
+@pytest.mark.parametrize("fan_out", [-1, 0, 1])
+def test_index_fan_out_below_two_is_rejected(fan_out: int):
+    # Arrange
+    command = create_jinja_command()
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="at least 2"):
+        JinjaConstructor(index_fan_out=fan_out)
+
+    with pytest.raises(SystemExit):
+        command.parser.parse_args(["--index-fan-out", str(fan_out), "xml", "build"])
+
+
+def test_construct_builds_index_tree(tmp_path: Path):
+    # Arrange
+    context = create_context(
+        create_class("Object"),
+        create_class("Node", parents=["Object"]),
+        create_class("Node2D", parents=["Node", "Object"]),
+        create_class("Resource", parents=["Object"]),
+        name="Docs",
+    )
+
+    constructor = JinjaConstructor(index_fan_out=10, index_grouping="parents")
+
+    # Act
+    constructor.construct(context, tmp_path)
+
+    # Assert
+    index = (tmp_path / "index.rst").read_text()
+    subindex = (tmp_path / "index-Node.rst").read_text()
+
+    assert index.startswith("Docs\n====")
+    assert index.rstrip().endswith("index-Node\n   Object\n   Resource")
+    assert subindex.startswith("Node\n====")
+    assert subindex.rstrip().endswith("Node\n   Node2D")
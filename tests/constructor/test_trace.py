@@ -0,0 +1,54 @@
+import json
+import threading
+from pathlib import Path
+
+from godocs_jinja.constructor import JinjaConstructor, Tracer
+
+from conftest import create_class, create_context
+
+
+CONTEXT = create_context(create_class("Class1"))
+
+
+def test_tracer_records_setup_and_construction_spans(tmp_path: Path):
+    # Arrange
+    tracer = Tracer()
+
+    constructor = JinjaConstructor(tracer=tracer)
+
+    # Act
+    constructor.construct(CONTEXT, tmp_path / "build")
+
+    # Assert
+    names = [event["name"] for event in tracer.events]
+
+    for name in ["find_models", "find_templates", "load_filters", "create_env",
+                 "construct", "builder", "render", "write"]:
+        assert name in names
+
+    render = next(e for e in tracer.events if e["name"] == "render")
+
+    assert render["ph"] == "X"
+    assert render["dur"] >= 0
+    assert render["tid"] == threading.get_ident()
+    assert render["args"]["document"] in ["Class1", "index"]
+
+
+def test_tracer_writes_chrome_trace_events(tmp_path: Path):
+    # Arrange
+    tracer = Tracer()
+    trace_path = tmp_path / "trace.json"
+
+    with tracer.span("step", "test", value=1):
+        pass
+
+    # Act
+    tracer.write(trace_path)
+
+    # Assert
+    data = json.loads(trace_path.read_text())
+
+    assert data["traceEvents"][0]["ph"] == "M"
+    assert data["traceEvents"][0]["name"] == "thread_name"
+    assert data["traceEvents"][1]["name"] == "step"
+    assert data["traceEvents"][1]["args"] == {"value": 1}